@@ -1,6 +1,6 @@
 # The input parameters are defined here
 
-from helpers import ShapeType, LogRange, CoolantType
+from helpers import ShapeType, LogRange, CoolantType, SolverType, OptimizerType
 
 
 class Input:
@@ -10,6 +10,9 @@ class Input:
     # Habitat:
     population = 1e6  # [people], can be a number or list of numbers
     # (can be overriden by command-line arguments "--power", "--volume", or "--population")
+    isPopulationAdaptive = False  # if the sizes of a population list are chosen between its smallest and largest value where the results bend or a regime changes (not with isResultStreamed)
+    adaptiveInitialSizes = 30  # number of sizes of the initial sweep (at least 2, at most adaptiveEvaluations; only if isPopulationAdaptive)
+    adaptiveEvaluations = 150  # maximum number of sizes (only if isPopulationAdaptive)
     volumePerPerson = 1600  # [m³]
     powerPerPerson = 4e4  # [W]
     interiorMassPerPerson = 1e5  # [kg]
@@ -27,6 +30,7 @@ class Input:
     # Gravity Distribution
     constantFloorHeight = 5  # part that is independent of radius [m]
     variableFloorHeight = 5  # part that grows with lower gravity [m]
+    numberGravityBins = 0  # if > 0, the floors are aggregated into this number of radius bins for the structural computation
 
     # Structural Integrity
     stressPerDensity = 1e5  # tensile stress per density of structural material [Nm/kg]
@@ -34,6 +38,10 @@ class Input:
     maxGravity = 9.81  # [m/s²]
     distanceBetweenVerticalCables = 10  # [m]
     bridgeThickness = 1  # [m]
+    numberSupportShells = 10  # number of shells for the support of the radiator, light and electricity collection
+    isSupportAdaptive = False  # if this support is computed by adaptive quadrature instead of shells
+    supportRelativeTolerance = 1e-6  # (only if isSupportAdaptive)
+    isStructureTabulated = False  # if the vertical structural fraction is interpolated from a table (relative error Structure.tableError) instead of evaluated exactly
 
     # Energy Collection:
     solarDistance = 1  # distance to the Sun [AU=1.5e11m]
@@ -63,6 +71,9 @@ class Input:
     outerGapEmissivity = 0.9  #
     gapTransferCoeff = 5  # [W/Km**2]
     gapConductivity = 0.01  # [W/Km]
+    isGapRadiationExact = False  # if the radiation across the gap is computed exactly instead of by a series of reflections (to 1%)
+    hullSolver = SolverType.Damped  # Damped (fixed-point iteration to 0.1 W/m²) or Brent (bracketed root finding)
+    hullRelativeTolerance = 1e-6  # relative tolerance of the power through the hull (only for Brent)
 
     # Coolant:
     coolantType = CoolantType.Liquid
@@ -97,13 +108,31 @@ class Input:
     pumpEfficiency = 0.8  # efficiency of pump or fan
     minFrictionFactor = 0.005  # assumed minimum friction factor at very high Reynolds
     isFrictionOptimized = False  # if friction fractions are optimized or fixed
+    frictionOptimizer = OptimizerType.SingleStep  # SingleStep (one analytic update) or Iterated (updates until the cooling mass converges)
+    frictionRelativeTolerance = 1e-6  # relative change of the cooling mass at convergence (only for Iterated)
+    maxFrictionIterations = 50  # (only for Iterated)
+    isFrictionWarmStarted = False  # if each size of a sweep starts from the optimized friction of the previous size (mainly for Iterated)
     absorptionFrictionFraction = 0.01  # fraction of the habitat power devoted to overcome friction in heat absorption (not for Air)
     connectionFrictionFraction = 0.01  # fraction of the habitat power devoted to overcome friction in heat connection
     emissionFrictionFraction = 0.01  # fraction of the habitat power devoted to overcome friction in heat emission
     maxFrictionFraction = 0.5  # maximum fraction of the habitat power devoted to overcome friction
 
+    # Computation:
+    isBatchComputed = False  # if all sizes are computed at once as arrays (only closed-form quantities, without gravity, structure and friction optimization)
+    isResultStored = False  # if computed size sweeps are stored in the project directory and reloaded as long as the input is unchanged (without gravity distributions)
+    isResultCompact = False  # if only the scalar quantities of each size of a sweep are kept, as columns (and the first habitat complete), to save memory
+    isResultStreamed = False  # if the sizes of a sweep are written one at a time to a table in the project directory (sweep_run<run>.csv) while computed, and only the limits are printed (main.py, without figures)
+    isLimitRefined = False  # if the limits of a sweep (e.g. no complete cooling above a population) are located between its sizes by additional habitats
+    limitRelativeTolerance = 1e-3  # of the population at a limit (only if isLimitRefined)
+
+    # Design search (designSearch.py):
+    designShapeTypes = [ShapeType.Cylinder, ShapeType.Tube, ShapeType.Oblate, ShapeType.Torus, ShapeType.Dumbbell, ShapeType.DumbbellTube]
+    designMaxRotationRate_rpm = 3  # constraint, besides complete cooling and lighting
+    designRefinements = 6  # number of refinements of the ratio grid around the best design of each shape type
+
     # multiple runs:
     numberRuns = 7  # set e.g. to 6 to compute examples with changeParameters
+    numberProcesses = None  # number of parallel processes for multiple runs (None: all cores, 1: serial)
     iRun = 0  # initialized
     label = []  # initialized
 
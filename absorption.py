@@ -5,18 +5,24 @@ from input import Input
 
 
 class Absorption:
+    __slots__ = ("absorptionFrictionPower", "massFlow", "absorptionSurface", "absorptionSurfaceMass", "isCoolingPossible", "numberIterations",
+                 "absorptionVelocity", "absorptionReynolds", "report", "absorptionCrossSection", "absorptionPipeDiameter", "absorptionPipeNumber",
+                 "absorptionCoolantMass", "absorptionVolume")
+
     def __init__(self, inp: Input, coolingPower, absFriction, conFriction, emFriction, habRadius, habVolume):
-        coolingHelper = helpers.CoolingHelper(inp)
+        coolingHelper = helpers.CoolingHelper.getForInput(inp)
         self.absorptionFrictionPower = absFriction * coolingPower
         self.massFlow = (coolingPower + self.absorptionFrictionPower) / coolingHelper.internalEnergyChange
         self.absorptionSurface = coolingHelper.absorptionSurfacePerPower * coolingPower
         self.absorptionSurfaceMass = self.absorptionSurface * inp.absorptionSurfaceDensity
 
         self.isCoolingPossible = True  # initialisation
+        self.numberIterations = 0  # of the massFlow (for Air)
         if inp.coolantType == helpers.CoolantType.Air and self.massFlow > 0:
             lastMassFlow = 2 * self.massFlow  # only for iteration criterium
             while abs(self.massFlow - lastMassFlow) / lastMassFlow > 0.01:
                 lastMassFlow = self.massFlow
+                self.numberIterations += 1
                 self.absorptionVelocity = 2 * habRadius * self.massFlow \
                                           / (coolingHelper.coolantDensity * inp.windyVolumeFraction * habVolume)
                 self.absorptionReynolds = 8 * habRadius * self.massFlow / max(1e-10, self.absorptionSurface) / coolingHelper.viscosity
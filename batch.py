@@ -0,0 +1,306 @@
+# the closed-form quantities of a whole size sweep are computed here at once, as arrays over the habitat powers
+# (same model as in Habitat, but without gravity distribution and structure)
+
+import math
+
+import numpy as np
+
+import helpers
+from input import Input
+from results import SweepResults
+from shape import Shape
+
+
+class HabitatBatch:
+    def __init__(self, inp: Input, habPowers, absFriction, conFriction, emFriction, hullPowerPerSurface):
+        self.inp = inp
+        self.coolingHelper = helpers.CoolingHelper.getForInput(inp)
+        self.columns = {}
+        col = self.columns
+
+        habPower = np.asarray(habPowers, dtype=float)
+        col["habPower"] = habPower
+        col["population"] = habPower / inp.powerPerPerson
+
+        shape = Shape(inp, col["population"] * inp.volumePerPerson)
+        for name in ["habVolume", "rotationalRadius", "oppositeRotationalRadius", "hullSurface", "crossSection",
+                     "hullMass", "hullVolume", "airMass", "interiorMass"]:
+            col["shape." + name] = np.broadcast_to(getattr(shape, name), habPower.shape).astype(float)
+        habVolume = col["shape.habVolume"]
+        hullSurface = col["shape.hullSurface"]
+        crossSection = col["shape.crossSection"]
+        rotRadius = col["shape.rotationalRadius"]
+
+        habRadius = (crossSection / math.pi) ** .5
+        col["effectiveHabRadius"] = habRadius
+        col["effectiveHabLength"] = habVolume / crossSection
+        col["hullPowerPerSurface"] = np.full(habPower.shape, float(hullPowerPerSurface))
+
+        # Light
+        electricFraction = np.full(habPower.shape, float(inp.electricFraction))
+        light = self.lightCollection(habPower * (1 - electricFraction), habRadius, crossSection)
+        isCompleteLighting = light["isUnconcentratedLightingPossible"] | (
+            (light["lightVolume"] < inp.maxLightVolumeFraction * habVolume) & (light["windowArea"] < hullSurface))
+        if not np.all(isCompleteLighting):
+            electricFraction = np.where(isCompleteLighting, electricFraction, 1 - (1 - inp.electricFraction) * np.minimum(
+                inp.maxLightVolumeFraction * habVolume / light["lightVolume"], hullSurface / light["windowArea"]))
+            light = self.lightCollection(habPower * (1 - electricFraction), habRadius, crossSection)
+        col["isCompleteLighting"] = isCompleteLighting
+        col["electricFraction"] = electricFraction
+        col["lightPower"] = habPower * (1 - electricFraction)
+        for name, values in light.items():
+            col["lightCollection." + name] = values
+
+        outsidePower = (1 - inp.insidePowerFraction) * habPower
+        insidePower = habPower - outsidePower + light["lightAbsPower"] + light["windowToHabPower"]
+        hullPower = np.minimum(insidePower, hullPowerPerSurface * (hullSurface - light["windowArea"]))
+        coolingPower = insidePower - hullPower + light["windowCoolingPower"]
+        col["outsidePower"] = outsidePower
+        col["insidePower"] = insidePower
+        col["hullPower"] = hullPower
+        col["coolingPower"] = coolingPower
+
+        # Cooling
+        self.computeAbsorption(coolingPower, absFriction, conFriction, emFriction, habRadius, habVolume)
+        absFriction = col["absorption.absorptionFrictionPower"] / np.maximum(1e-10, coolingPower)
+        col["absFriction"] = absFriction
+        col["conFriction"] = np.full(habPower.shape, float(conFriction))
+        col["emFriction"] = np.full(habPower.shape, float(emFriction))
+
+        coRotRadius = (inp.stressPerDensity * rotRadius / inp.maxGravity) ** .5
+        col["structure.coRotationalRadius"] = coRotRadius
+        col["structure.rotationRate_rpm"] = (inp.maxGravity / rotRadius) ** .5 * 30 / math.pi
+        self.computeEmission(coolingPower, absFriction, conFriction, emFriction, col["absorption.massFlow"],
+                             outsidePower, rotRadius, coRotRadius)
+        self.computeConnection(habRadius, col["effectiveHabLength"], col["absorption.massFlow"],
+                               col["absorption.absorptionVolume"], habVolume)
+        col["isCoolingPossible"] = col["absorption.isCoolingPossible"] & col["connection.isCoolingPossible"]
+
+        # Electricity
+        electricCoolingPower = ((1 + absFriction) * (1 + conFriction) * (1 + emFriction) - 1) * coolingPower
+        electricMassPerPower = inp.electricSurfaceDensity / inp.getIrradiation() / inp.electricEfficiency
+        col["electricCoolingPower"] = electricCoolingPower
+        col["electricCoolingMass"] = electricMassPerPower * electricCoolingPower
+        col["electricHabMass"] = electricMassPerPower * habPower * electricFraction
+        col["electricPower"] = habPower * electricFraction + electricCoolingPower
+        col["electricArea"] = col["electricPower"] / inp.getIrradiation() / inp.electricEfficiency
+        col["electricMass"] = col["electricArea"] * inp.electricSurfaceDensity
+
+        col["collectionRadius"] = ((col["electricArea"] + light["lightCollectionArea"]) / math.pi) ** .5
+        col["lightRadius"] = (light["lightCollectionArea"] / math.pi) ** .5
+
+        col["totalCoolingMass"] = col["absorption.absorptionCoolantMass"] + col["connection.connectionCoolantMass"] \
+            + col["emission.emissionCoolantMass"] + col["absorption.absorptionSurfaceMass"] \
+            + col["connection.connectionSurfaceMass"] + col["emission.emissionSurfaceMass"] + col["electricCoolingMass"]
+
+        self.results = SweepResults(inp.iRun, self.columns)
+
+    def lightCollection(self, lightPower, habRadius, crossSection):
+        inp = self.inp
+        light = {}
+        maxAngularDeviation = inp.concentrationFactor ** .5 * 7 / 1.5e3 / inp.solarDistance
+        light["lightChannelSurface"] = lightPower / inp.surfaceIntensity
+        light["lightAbsPower"] = light["lightChannelSurface"] * (1 - inp.innerReflectivity) \
+            * inp.getIrradiation() * (inp.solarDistance * 1.5e11) ** 2 / (3 * 7e8 ** 2) * inp.outerReflectivity \
+            * (1 - inp.windowReflectivity - inp.windowAbsorptivity) * maxAngularDeviation ** 3
+        windowPower = (lightPower + light["lightAbsPower"]) / (1 - inp.windowReflectivity - inp.windowAbsorptivity)
+        light["windowPower"] = windowPower
+        light["lightCollectionArea"] = windowPower / inp.outerReflectivity / inp.getIrradiation()
+        windowArea = light["lightCollectionArea"] / inp.concentrationFactor
+        light["windowArea"] = windowArea
+        light["lightMass"] = (light["lightCollectionArea"] + light["lightChannelSurface"]) * inp.lightSurfaceDensity
+        windowTemperature = np.minimum(inp.maxWindowTemperature, (1 / 2 * (inp.windowAbsorptivity * windowPower
+                                       / (windowArea * inp.emissivity * 5.67e-8) + inp.skyTemp ** 4 + inp.maxHabTemp ** 4)) ** .25)
+        light["windowTemperature"] = windowTemperature
+        light["windowCoolingPower"] = np.where(windowTemperature < inp.maxWindowTemperature, 0,
+                                               inp.windowAbsorptivity * windowPower - windowArea * inp.emissivity
+                                               * 5.67e-8 * (2 * windowTemperature ** 4 - inp.skyTemp ** 4 - inp.maxHabTemp ** 4))
+        light["windowToHabPower"] = windowArea * inp.emissivity * 5.67e-8 * (windowTemperature ** 4 - inp.maxHabTemp ** 4)
+        light["lightVolume"] = (lightPower + light["lightAbsPower"]) \
+            / (3 * inp.outerReflectivity * (1 - inp.windowReflectivity - inp.windowAbsorptivity)
+               * inp.concentrationFactor * inp.getIrradiation()) * habRadius
+        light["isUnconcentratedLightingPossible"] = light["lightCollectionArea"] < crossSection
+        return light
+
+    def computeAbsorption(self, coolingPower, absFriction, conFriction, emFriction, habRadius, habVolume):
+        inp, ch, col = self.inp, self.coolingHelper, self.columns
+        frictionPower = absFriction * coolingPower
+        massFlow = (coolingPower + frictionPower) / ch.internalEnergyChange
+        surface = ch.absorptionSurfacePerPower * coolingPower
+        if inp.coolantType == helpers.CoolantType.Air:  # iteration of all habitats at once, until each has converged
+            reynolds = 8 * habRadius * massFlow / np.maximum(1e-10, surface) / ch.viscosity
+            velocity = np.zeros(coolingPower.shape)
+            isCoolingPossible = np.full(coolingPower.shape, True)
+            numberIterations = np.zeros(coolingPower.shape, dtype=int)
+            lastMassFlow = 2 * massFlow
+            isIterated = massFlow > 0
+            while np.any(isIterated):
+                i = np.nonzero(isIterated)[0]
+                lastMassFlow[i] = massFlow[i]
+                velocity[i] = 2 * habRadius[i] * massFlow[i] / (ch.coolantDensity * inp.windyVolumeFraction * habVolume[i])
+                reynolds[i] = 8 * habRadius[i] * massFlow[i] / np.maximum(1e-10, surface[i]) / ch.viscosity
+                frictionPower[i] = helpers.frictionFactor(reynolds[i], inp.minFrictionFactor) * ch.coolantDensity / 8 \
+                    / inp.pumpEfficiency * surface[i] * velocity[i] ** 3
+                massFlow[i] = (coolingPower[i] + frictionPower[i]) / ch.internalEnergyChange
+                numberIterations[i] += 1
+                isCoolingPossible[i] = frictionPower[i] <= (inp.maxFrictionFraction - conFriction - emFriction) * coolingPower[i]
+                isIterated[i] = isCoolingPossible[i] & (np.abs(massFlow[i] - lastMassFlow[i]) / lastMassFlow[i] > 0.01)
+            isZero = massFlow == 0
+            velocity[isZero] = (8 * inp.pumpEfficiency * frictionPower[isZero] / helpers.frictionFactor(reynolds[isZero], inp.minFrictionFactor)
+                                / ch.coolantDensity / np.maximum(1e-10, surface[isZero])) ** (1 / 3)
+
+            col["absorption.absorptionFrictionPower"] = frictionPower
+            col["absorption.massFlow"] = massFlow
+            col["absorption.absorptionSurface"] = surface
+            col["absorption.absorptionSurfaceMass"] = np.zeros(coolingPower.shape)
+            col["absorption.absorptionReynolds"] = reynolds
+            col["absorption.absorptionVelocity"] = velocity
+            col["absorption.absorptionCrossSection"] = massFlow / ch.coolantDensity / np.maximum(1e-10, velocity)
+            col["absorption.absorptionCoolantMass"] = np.zeros(coolingPower.shape)
+            col["absorption.absorptionVolume"] = inp.windyVolumeFraction * habVolume
+            col["absorption.isCoolingPossible"] = isCoolingPossible
+            col["absorption.numberIterations"] = numberIterations
+            return
+
+        reynolds = 8 * habRadius * massFlow / np.maximum(1e-10, surface) / ch.viscosity
+        velocity = (8 * inp.pumpEfficiency * frictionPower / helpers.frictionFactor(reynolds, inp.minFrictionFactor)
+                    / ch.coolantDensity / np.maximum(1e-10, surface)) ** (1 / 3)
+        if inp.coolantType == helpers.CoolantType.Vapor:
+            liquidReynolds = 8 * habRadius * massFlow / np.maximum(1e-10, surface) / 1e-3
+            liquidVelocity = (8 * inp.pumpEfficiency * frictionPower / helpers.frictionFactor(liquidReynolds, inp.minFrictionFactor)
+                              / inp.liquidDensity / np.maximum(1e-10, surface)) ** (1 / 3)
+            coolantMass = massFlow * habRadius * (1 / np.maximum(1e-10, velocity) + 1 / np.maximum(1e-10, liquidVelocity))
+            volume = massFlow * habRadius * (1 / np.maximum(1e-10, velocity * ch.coolantDensity)
+                                             + 1 / np.maximum(1e-10, liquidVelocity * inp.liquidDensity))
+        else:  # Liquid
+            coolantMass = 2 * massFlow * habRadius / np.maximum(1e-10, velocity)
+            volume = coolantMass / ch.coolantDensity
+
+        col["absorption.absorptionFrictionPower"] = frictionPower
+        col["absorption.massFlow"] = massFlow
+        col["absorption.absorptionSurface"] = surface
+        col["absorption.absorptionSurfaceMass"] = surface * inp.absorptionSurfaceDensity
+        col["absorption.absorptionReynolds"] = reynolds
+        col["absorption.absorptionVelocity"] = velocity
+        col["absorption.absorptionCrossSection"] = massFlow / ch.coolantDensity / np.maximum(1e-10, velocity)
+        col["absorption.absorptionCoolantMass"] = coolantMass
+        col["absorption.absorptionVolume"] = volume
+        col["absorption.isCoolingPossible"] = np.full(coolingPower.shape, True)
+        col["absorption.numberIterations"] = np.zeros(coolingPower.shape, dtype=int)
+
+    def computeEmission(self, coolingPower, absFriction, conFriction, emFriction, massFlow, outsidePower, rotRadius, coRotRadius):
+        inp, ch, col = self.inp, self.coolingHelper, self.columns
+        absorptionFrictionPower = absFriction * coolingPower
+        connectionFrictionPower = conFriction * (coolingPower + absorptionFrictionPower)
+        emissionFrictionPower = emFriction * (coolingPower + absorptionFrictionPower + connectionFrictionPower)
+
+        connectionTempIncrease = connectionFrictionPower / (2 * ch.heatCapacity * np.maximum(1e-10, massFlow))
+        if inp.coolantType == helpers.CoolantType.Vapor:
+            basicEmissionSurface = (coolingPower + absorptionFrictionPower + connectionFrictionPower) \
+                / (inp.emissivity * 5.67e-8 * ch.incomingTemp ** 4)
+        else:  # Liquid and Air
+            basicEmissionSurface = massFlow * ch.heatCapacity / (3 * inp.emissivity * 5.67e-8) \
+                * ((ch.incomingTemp - connectionTempIncrease) ** -3 - (ch.outgoingTemp + connectionTempIncrease) ** -3)
+        if inp.coolantType == helpers.CoolantType.Air:
+            def humidityToT4(T):
+                return 18 / 30 * 611 / inp.airPressure / 1e5 * np.exp(5321 * (1 / 273 - 1 / T)) * T ** -4
+
+            Tav = (ch.outgoingDewPoint + ch.incomingTemp - connectionTempIncrease) / 2
+            basicEmissionSurface = basicEmissionSurface + massFlow * 2.45e6 / (inp.emissivity * 5.67e-8) \
+                * (humidityToT4(ch.outgoingDewPoint) - humidityToT4(ch.incomingTemp - connectionTempIncrease)
+                   + 4 * humidityToT4(Tav) * (ch.outgoingDewPoint - ch.incomingTemp + connectionTempIncrease) / Tav)
+
+        effectiveTemp = ((coolingPower + absorptionFrictionPower + connectionFrictionPower)
+                         / (inp.emissivity * 5.67e-8 * np.maximum(1e-10, basicEmissionSurface))) ** (1 / 4)
+        surface = (1 + emFriction + outsidePower / np.maximum(1e-10, coolingPower)) \
+            * effectiveTemp ** 4 / (effectiveTemp ** 4 - inp.skyTemp ** 4) * basicEmissionSurface
+        radius = np.minimum(inp.maxRadiatorToCorotRadius * coRotRadius,
+                            np.minimum(inp.maxRadiatorToRotRadius * rotRadius, surface ** .5 / 4))
+
+        reynolds = 8 * radius * massFlow / np.maximum(1e-10, surface) / ch.viscosity
+        velocity = (8 * inp.pumpEfficiency * emissionFrictionPower / helpers.frictionFactor(reynolds, inp.minFrictionFactor)
+                    / ch.coolantDensity / np.maximum(1e-10, surface)) ** (1 / 3)
+        crossSection = massFlow / ch.coolantDensity / np.maximum(1e-10, velocity)
+
+        if inp.coolantType == helpers.CoolantType.Vapor:
+            liquidReynolds = 8 * radius * massFlow / np.maximum(1e-10, surface) / 1e-3
+            liquidVelocity = (8 * inp.pumpEfficiency * emissionFrictionPower / helpers.frictionFactor(liquidReynolds, inp.minFrictionFactor)
+                              / inp.liquidDensity / np.maximum(1e-10, surface)) ** (1 / 3)
+            coolantMass = massFlow * radius * (1 / np.maximum(1e-10, velocity) + 1 / np.maximum(1e-10, liquidVelocity))
+            volume = massFlow * radius * (1 / np.maximum(1e-10, velocity * ch.coolantDensity)
+                                          + 1 / np.maximum(1e-10, liquidVelocity * inp.liquidDensity))
+        else:
+            coolantMass = 2 * massFlow * radius / np.maximum(1e-10, velocity)
+            volume = coolantMass / ch.coolantDensity
+
+        col["emission.absorptionFrictionPower"] = absorptionFrictionPower
+        col["emission.connectionFrictionPower"] = connectionFrictionPower
+        col["emission.emissionFrictionPower"] = emissionFrictionPower
+        col["emission.radiatorPower"] = (1 + absFriction) * (1 + conFriction) * (1 + emFriction) * coolingPower
+        col["emission.effectiveTemp"] = effectiveTemp
+        col["emission.emissionSurface"] = surface
+        col["emission.emissionSurfaceMass"] = surface * inp.emissionSurfaceDensity
+        col["emission.emissionRadius"] = radius
+        col["emission.emissionReynolds"] = reynolds
+        col["emission.emissionVelocity"] = velocity
+        col["emission.emissionCrossSection"] = crossSection
+        col["emission.emissionCoolantMass"] = coolantMass
+        col["emission.emissionVolume"] = volume
+
+    def connectionVelocity(self, frictionPower, effectiveLength, massFlow, viscosity, density):
+        inp = self.inp
+        isConFrictionFactorMin = (frictionPower > 3.918e-10 / inp.minFrictionFactor ** 19 * viscosity ** 5
+                                  * effectiveLength / inp.pumpEfficiency / np.maximum(1e-10, massFlow * density) ** 2)
+        exponent = np.where(isConFrictionFactorMin, 2 / 5, 8 / 19)
+        velocity = np.where(isConFrictionFactorMin,
+                            (0.798 / inp.minFrictionFactor * inp.pumpEfficiency * frictionPower
+                             / effectiveLength / np.maximum(1e-10, density * massFlow) ** .5) ** (2 / 5),
+                            (2.383 * inp.pumpEfficiency * frictionPower / effectiveLength
+                             / np.maximum(1e-10, density * massFlow) ** (3 / 8) / viscosity ** (1 / 4)) ** (8 / 19))
+        return velocity, exponent
+
+    def computeConnection(self, habRadius, habLength, massFlow, absorptionVolume, habVolume):
+        inp, ch, col = self.inp, self.coolingHelper, self.columns
+        frictionPower = col["emission.connectionFrictionPower"]
+        emissionSurface = col["emission.emissionSurface"]
+
+        connectionLength = inp.hullSurfaceDensity / inp.hullDensity
+        absorptionLength = habLength / 2
+        emissionLength = emissionSurface / 8 / np.maximum(1e-10, col["emission.emissionRadius"])
+        effectiveLength = connectionLength + 2 / 3 * (absorptionLength + emissionLength)
+
+        velocity, exponent = self.connectionVelocity(frictionPower, effectiveLength, massFlow, ch.viscosity, ch.coolantDensity)
+        surface = 4 * effectiveLength * (2 * math.pi * massFlow / ch.coolantDensity / np.maximum(1e-10, velocity)) ** .5
+        crossSection = massFlow / ch.coolantDensity / np.maximum(1e-10, velocity)
+
+        if inp.coolantType == helpers.CoolantType.Vapor:
+            crossSection = crossSection / 2
+            liquidVelocity, exponent = self.connectionVelocity(frictionPower, effectiveLength, massFlow, 1e-3, inp.liquidDensity)
+            coolantMass = massFlow * (connectionLength + absorptionLength / 2 + emissionLength / 2) \
+                * (1 / np.maximum(1e-10, velocity) + 1 / np.maximum(1e-10, liquidVelocity))
+            volume = massFlow * (connectionLength + absorptionLength / 2 + emissionLength / 2) \
+                * (1 / np.maximum(1e-10, velocity * ch.coolantDensity) + 1 / np.maximum(1e-10, liquidVelocity * inp.liquidDensity))
+        else:
+            coolantMass = 2 * massFlow * (connectionLength + absorptionLength / 2 + emissionLength / 2) / np.maximum(1e-10, velocity)
+            volume = coolantMass / ch.coolantDensity
+
+        interiorConnectionVolume = absorptionLength / (2 * connectionLength + absorptionLength + emissionLength) * volume
+        coolantVolumeFraction = (absorptionVolume + interiorConnectionVolume) / habVolume
+        areaFraction = crossSection / math.pi / habRadius ** 2
+
+        col["connection.connectionFrictionPower"] = frictionPower
+        col["connection.emissionLength"] = emissionLength
+        col["connection.effectiveLength"] = effectiveLength
+        col["connection.totalLength"] = 2 * (absorptionLength + connectionLength + emissionLength)
+        col["connection.connectionVelocity"] = velocity
+        col["connection.connectionExponent"] = exponent
+        col["connection.connectionSurface"] = surface
+        col["connection.connectionSurfaceMass"] = surface * inp.emissionSurfaceDensity
+        col["connection.connectionCrossSection"] = crossSection
+        col["connection.connectionCoolantMass"] = coolantMass
+        col["connection.outerConnectionCoolantMass"] = emissionLength / (2 * connectionLength + absorptionLength + emissionLength) * coolantMass
+        col["connection.connectionVolume"] = volume
+        col["connection.coolantVolumeFraction"] = coolantVolumeFraction
+        col["connection.connectionAreaFraction"] = areaFraction
+        col["connection.isCoolingPossible"] = ~((areaFraction > 1) | ((inp.coolantType != helpers.CoolantType.Air)
+                                                                    & (coolantVolumeFraction > inp.maxCoolantVolumeFraction)))
@@ -5,11 +5,16 @@ from input import Input
 
 
 class Connection:
+    __slots__ = ("inp", "massFlow", "connectionFrictionPower", "connectionLength", "absorptionLength", "emissionLength", "effectiveLength", "totalLength",
+                 "connectionVelocity", "connectionSurface", "connectionSurfaceMass", "connectionPipeDiameter", "connectionCrossSection",
+                 "connectionCoolantMass", "connectionVolume", "outerConnectionCoolantMass", "coolantVolumeFraction", "connectionAreaFraction",
+                 "isCoolingPossible", "report", "connectionExponent")
+
     def __init__(self, inp: Input, habRadius, habLength, emissionSurface, emissionRadius, massFlow, absorptionVolume, habVolume, connectionFrictionPower):
         self.inp = inp
         self.massFlow = massFlow
         self.connectionFrictionPower = connectionFrictionPower
-        coolingHelper = helpers.CoolingHelper(inp)
+        coolingHelper = helpers.CoolingHelper.getForInput(inp)
 
         self.connectionLength = inp.hullSurfaceDensity / inp.hullDensity
         self.absorptionLength = habLength / 2
@@ -0,0 +1,25 @@
+# the cooling of a habitat is evaluated here for different friction fractions, without gravity and structure
+# (e.g. for the friction optimization)
+
+import copy
+
+from habitat import Habitat
+from input import Input
+
+
+class CoolingEvaluator:
+    def __init__(self, inp: Input, habPower, absFriction, conFriction, emFriction, hullPowerPerSurface=None):
+        self.inp = inp
+        self.startHabitat = Habitat(inp, habPower, absFriction, conFriction, emFriction, hullPowerPerSurface, isStructureComputed=False)
+        self.numberEvaluations = 1  # of the cooling
+
+    def evaluate(self, absFriction, conFriction, emFriction):  # habitat without structure, sharing shape and light
+        hab = copy.copy(self.startHabitat)
+        hab.computeCooling(self.inp, absFriction, conFriction, emFriction)
+        self.numberEvaluations += 1
+        return hab
+
+    def complete(self, hab: Habitat):  # full habitat, e.g. for the optimum
+        hab = copy.copy(hab)
+        hab.computeStructure(self.inp)
+        return hab
@@ -0,0 +1,166 @@
+# the habitat design (shape type and geometry ratios) with the lowest mass per person is searched here for a given population
+# usage: python designSearch.py --population 1e4
+
+import argparse
+import copy
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import optimizer
+from habitat import Habitat
+from helpers import ShapeType
+from hullTransfer import HullTransfer
+from input import Input
+from shape import Shape
+from snapshot import InputSnapshot
+
+
+def evaluateDesign(inp: Input, population, shapeType: ShapeType, ratios: {str: float}):  # (module function for the process pool)
+    inp = copy.copy(inp)
+    inp.population = population
+    inp.shapeType = shapeType
+    for name, value in ratios.items():
+        setattr(inp, name, value)
+    power = population * inp.powerPerPerson
+    try:
+        if inp.isFrictionOptimized:
+            shape = Shape(inp, population * inp.volumePerPerson)
+            hab = optimizer.getOptimizedResult(inp, power, HullTransfer.getPowerPerSurface(inp, shape.crossSection / shape.hullSurface))
+        else:
+            hab = Habitat(inp, power, inp.absorptionFrictionFraction, inp.connectionFrictionFraction, inp.emissionFrictionFraction)
+    except Exception as exception:  # e.g. too asymmetric dumbbell
+        return {"error": str(exception)}
+    return {"massPerPerson": float(hab.totalMass / population), "rotationRate_rpm": float(hab.structure.rotationRate_rpm),
+            "isCoolingPossible": bool(hab.isCoolingPossible), "isCompleteLighting": bool(hab.isCompleteLighting)}
+
+
+class DesignSearch:
+    # ratio parameters of each shape type, with their search range
+    ratioRanges = {ShapeType.Cylinder: {"cylinderLengthToRotRadius": (0.1, 10)},
+                   ShapeType.Tube: {"tubeRadiusToRotRadius": (0.01, 1)},
+                   ShapeType.Oblate: {"oblateMinorToRotRadius": (0.05, 1)},
+                   ShapeType.Torus: {"torusHabToRotRadius": (0.02, 0.5)},
+                   ShapeType.Dumbbell: {"dumbbellMinorToRotRadius": (0.02, 0.5), "dumbbellMajorToMinorRadius": (1, 3)},
+                   ShapeType.DumbbellTube: {"dumbbellMinorToRotRadius": (0.02, 0.5), "dumbbellMajorToMinorRadius": (1, 3),
+                                            "tubeRadiusToRotRadius": (0.01, 1)}}
+    numberGridPoints = 5  # per ratio in the initial grid
+    ratioDigits = 6  # significant digits of the ratios
+    searchFields = ("shapeType", "numberProcesses", "designShapeTypes", "designMaxRotationRate_rpm", "designRefinements")
+
+    def __init__(self, inp: Input, population, statePath: str = None):
+        self.inp = inp
+        self.population = population
+        self.statePath = statePath if statePath is not None else os.path.join(inp.project, "designSearch.json")
+        inputCopy = copy.copy(inp)
+        inputCopy.population = population
+        for name in self.searchFields:  # the stored evaluations do not depend on them
+            setattr(inputCopy, name, getattr(Input, name))
+        self.digest = InputSnapshot(inputCopy).digest  # stored evaluations are only reused for the same input
+        self.evaluations = {}  # {(shape type name, ((ratio name, value), ...)): record}
+        self.numberComputed = 0  # evaluations not taken from the stored state
+        self.loadState()
+
+    def loadState(self):
+        if not os.path.exists(self.statePath):
+            return
+        with open(self.statePath) as file:
+            state = json.load(file)
+        if state["digest"] == self.digest:
+            self.evaluations = {(shapeName, tuple(tuple(item) for item in ratios)): record
+                                for shapeName, ratios, record in state["evaluations"]}
+
+    def saveState(self):
+        directory = os.path.dirname(self.statePath)
+        if directory != "":
+            os.makedirs(directory, exist_ok=True)
+        state = {"digest": self.digest,
+                 "evaluations": [[shapeName, [list(item) for item in ratios], record] for (shapeName, ratios), record in self.evaluations.items()]}
+        with open(self.statePath + ".tmp", "w") as file:
+            json.dump(state, file)
+        os.replace(self.statePath + ".tmp", self.statePath)  # a complete state, even if interrupted
+
+    def isFeasible(self, record):
+        return "error" not in record and record["isCoolingPossible"] and record["isCompleteLighting"] \
+            and record["rotationRate_rpm"] <= self.inp.designMaxRotationRate_rpm
+
+    def getRanking(self, record):  # feasible designs first, then by mass per person
+        if "error" in record:
+            return 2, math.inf
+        return (0 if self.isFeasible(record) else 1), record["massPerPerson"]
+
+    def getKey(self, shapeType: ShapeType, ratios: {str: float}):
+        return shapeType.name, tuple((name, float("%.*g" % (self.ratioDigits, ratios[name]))) for name in sorted(ratios))
+
+    def evaluate(self, executor, candidates):  # [(shapeType, ratios)] into evaluations, in parallel if not yet stored
+        newKeys = []
+        for shapeType, ratios in candidates:
+            key = self.getKey(shapeType, ratios)
+            if key not in self.evaluations and key not in newKeys:
+                newKeys.append(key)
+        if len(newKeys) > 0:
+            arguments = [(self.inp, self.population, ShapeType[shapeName], dict(ratios)) for shapeName, ratios in newKeys]
+            if executor is None:
+                records = [evaluateDesign(*argument) for argument in arguments]
+            else:
+                records = executor.map(evaluateDesign, *zip(*arguments))
+            for key, record in zip(newKeys, records):
+                self.evaluations[key] = record
+            self.numberComputed += len(newKeys)
+            self.saveState()
+
+    def getCandidates(self, shapeType: ShapeType, center, logSteps, numberPoints):  # grid around center in log space
+        candidates = [{}]
+        for name, (minValue, maxValue) in self.ratioRanges[shapeType].items():
+            values = [min(maxValue, max(minValue, center[name] * math.exp(logSteps[name] * (i - (numberPoints - 1) / 2))))
+                      for i in range(numberPoints)]
+            candidates = [dict(candidate, **{name: value}) for candidate in candidates for value in values]
+        return [(shapeType, candidate) for candidate in candidates]
+
+    def search(self, executor):  # for each shape type a grid, then refinements around the best ratios (evaluated together)
+        logSteps, candidates = {}, {}
+        for shapeType in self.inp.designShapeTypes:
+            ranges = self.ratioRanges[shapeType]
+            center = {name: (minValue * maxValue) ** .5 for name, (minValue, maxValue) in ranges.items()}
+            logSteps[shapeType] = {name: math.log(maxValue / minValue) / (self.numberGridPoints - 1) for name, (minValue, maxValue) in ranges.items()}
+            candidates[shapeType] = self.getCandidates(shapeType, center, logSteps[shapeType], self.numberGridPoints)
+
+        designs = {}
+        for iRefinement in range(self.inp.designRefinements + 1):
+            self.evaluate(executor, [candidate for shapeType in candidates for candidate in candidates[shapeType]])
+            for shapeType in candidates:
+                bestRatios = min((ratios for _, ratios in candidates[shapeType]),
+                                 key=lambda ratios: self.getRanking(self.evaluations[self.getKey(shapeType, ratios)]))
+                designs[shapeType] = bestRatios, self.evaluations[self.getKey(shapeType, bestRatios)]
+                logSteps[shapeType] = {name: step / 2 for name, step in logSteps[shapeType].items()}
+                candidates[shapeType] = self.getCandidates(shapeType, bestRatios, logSteps[shapeType], 3)
+        return designs
+
+    def run(self):  # {shapeType: (ratios, record)} of the best design of each shape type
+        if self.inp.numberProcesses == 1:
+            return self.search(None)
+        with ProcessPoolExecutor(max_workers=self.inp.numberProcesses) as executor:
+            return self.search(executor)
+
+    def getBest(self, designs):  # shapeType, ratios, record
+        shapeType = min(designs, key=lambda shapeType: self.getRanking(designs[shapeType][1]))
+        return shapeType, designs[shapeType][0], designs[shapeType][1]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Search of the habitat shape type and geometry ratios with the lowest mass per person. Edit input.py for the other parameters.")
+    parser.add_argument("--population", type=float, help="habitat population", default=1e4)
+    args = parser.parse_args()
+
+    search = DesignSearch(Input(), args.population)
+    designs = search.run()
+    print("Designs for population %.1e (%i new evaluations, %i stored):" % (args.population, search.numberComputed, len(search.evaluations) - search.numberComputed))
+    for shapeType, (ratios, record) in designs.items():
+        if "error" in record:
+            print("%s: %s" % (shapeType.name, record["error"]))
+            continue
+        print("%s: %.3e kg per person, %.2f rpm%s, %s" % (shapeType.name, record["massPerPerson"], record["rotationRate_rpm"],
+              "" if search.isFeasible(record) else " (constraints not met)", ", ".join("%s %.3g" % item for item in ratios.items())))
+    shapeType, ratios, record = search.getBest(designs)
+    print("Best design: " + shapeType.name)
@@ -1,21 +1,21 @@
 from input import Input
 from structure import Structure
 import matplotlib.pyplot as plt
+import numpy as np
 
 class DisplayStructuralFraction:
     def __init__(self):
         self.inp = Input()
         self.inp.distanceBetweenVerticalCables = 50
+        self.inp.isStructureTabulated = True
 
         struc = Structure(self.inp, rotationalRadius=100)
 
         N = 1000
-        xvals = [i/N * 1.5 for i in range(N)]  # fractions of co-rot. radius
-        vert = [struc.ComputeVerticalStructuralFraction(radius=xvals[i] * struc.coRotationalRadius,
-                                                        withBridges=False) for i in range(N)]
-        vertBridges = [struc.ComputeVerticalStructuralFraction(radius=xvals[i] * struc.coRotationalRadius,
-                                                        withBridges=True) for i in range(N)]
-        hor = [struc.ComputeHorizontalStructuralFraction(radius= xvals[i] * struc.coRotationalRadius) for i in range(N)]
+        xvals = np.arange(N) / N * 1.5  # fractions of co-rot. radius
+        vert = struc.ComputeVerticalStructuralFraction(radius=xvals * struc.coRotationalRadius, withBridges=False)
+        vertBridges = struc.ComputeVerticalStructuralFraction(radius=xvals * struc.coRotationalRadius, withBridges=True)
+        hor = struc.ComputeHorizontalStructuralFraction(radius=xvals * struc.coRotationalRadius)
         noself = [struc.ComputeStructuralFractionWithoutSelfWeight(radius= xvals[i] * struc.coRotationalRadius) for i in range(N)]
 
         fig, ax = plt.subplots()
@@ -4,8 +4,12 @@ from input import Input
 
 
 class Emission:
+    __slots__ = ("absorptionFrictionPower", "connectionFrictionPower", "emissionFrictionPower", "radiatorPower", "effectiveTemp", "emissionSurface",
+                 "emissionSurfaceMass", "emissionRadius", "emissionReynolds", "emissionVelocity", "emissionCrossSection", "emissionPipeDiameter",
+                 "emissionPipeNumber", "emissionCoolantMass", "emissionVolume")
+
     def __init__(self, inp: Input, coolingPower, absFriction, conFriction, emFriction, massFlow, outsidePower, rotRadius, coRotRadius):
-        coolingHelper = helpers.CoolingHelper(inp)
+        coolingHelper = helpers.CoolingHelper.getForInput(inp)
         self.absorptionFrictionPower = absFriction * coolingPower
         self.connectionFrictionPower = conFriction * (coolingPower + self.absorptionFrictionPower)
         self.emissionFrictionPower = emFriction * (coolingPower + self.absorptionFrictionPower
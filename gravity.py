@@ -1,69 +1,74 @@
 from helpers import ShapeType
 from input import Input
 import math
+import numpy as np
 
 
 class Gravity:
+    __slots__ = ("inp", "rotationalRadius", "oppositeRotationalRadius", "groundRadii", "floorRadii", "groundAreas", "floorVolumes", "hullAreas",
+                 "numberFloors", "averageVolumetricGravity", "averageGroundGravity", "extraHullArea", "averageHullGravity")
+
     def __init__(self, inp: Input, rotationalRadius: float, oppositeRotationalRadius: float = 0):
         self.inp = inp
         self.rotationalRadius = rotationalRadius
         self.oppositeRotationalRadius = oppositeRotationalRadius
 
-        self.floorVolumes = []
-        self.groundAreas = []
-        self.hullAreas = []
-        self.groundRadii = []
-        self.floorRadii = []
-
-        self.numberFloors = 0
+        # floor radii from the rotational radius towards the axis (a sequential recurrence, with scalar arithmetic only)
+        lowerRadii = []
         lowerRadius = rotationalRadius
         while lowerRadius > 0:
-            height = self.NextFloorHeight(lowerRadius)
-            upperRadius = lowerRadius - height
-            if upperRadius < 0:
-                upperRadius = 0
-            floorRadius = (lowerRadius + upperRadius) / 2
-
-            self.groundRadii.append(lowerRadius)
-            self.floorRadii.append(floorRadius)
-
-            groundArea = self.GroundArea(lowerRadius)
-            self.groundAreas.append(groundArea)
-
-            volume = height * self.GroundArea(floorRadius)
-            self.floorVolumes.append(volume)
-            if volume > 0 or groundArea > 0:
-                self.numberFloors += 1
-
-            hullArea = height * self.HullOrientedLength(floorRadius)
-            self.hullAreas.append(hullArea)
-
-            lowerRadius = upperRadius
-
-        self.floorVolumesTimesGrav = [self.floorVolumes[i] * self.floorRadii[i] / rotationalRadius * inp.maxGravity for i in range(len(self.floorVolumes))]
-        if sum(self.floorVolumes) > 0:
-            self.averageVolumetricGravity = sum(self.floorVolumesTimesGrav) / sum(self.floorVolumes)
+            lowerRadii.append(lowerRadius)
+            lowerRadius -= inp.constantFloorHeight + inp.variableFloorHeight * rotationalRadius / lowerRadius
+        self.groundRadii = np.array(lowerRadii)
+        heights = self.NextFloorHeight(self.groundRadii)
+        upperRadii = np.maximum(self.groundRadii - heights, 0)
+        self.floorRadii = (self.groundRadii + upperRadii) / 2
+
+        # shape-specific areas and lengths of all floors at once
+        self.groundAreas = self.GroundArea(self.groundRadii)
+        self.floorVolumes = heights * self.GroundArea(self.floorRadii)
+        self.hullAreas = heights * self.HullOrientedLength(self.floorRadii)
+        self.numberFloors = int(np.count_nonzero((self.floorVolumes > 0) | (self.groundAreas > 0)))
+
+        floorVolumesTimesGrav = self.floorVolumes * self.floorRadii / rotationalRadius * inp.maxGravity
+        totalVolume = np.sum(self.floorVolumes)
+        if totalVolume > 0:
+            self.averageVolumetricGravity = np.sum(floorVolumesTimesGrav) / totalVolume
         else:
             self.averageVolumetricGravity = self.floorRadii[0] / rotationalRadius * inp.maxGravity
 
-        self.groundAreasTimesGrav = [self.groundAreas[i] * self.groundRadii[i] / rotationalRadius * inp.maxGravity for i in range(len(self.groundAreas))]
-        if sum(self.groundAreas) > 0:
-            self.averageGroundGravity = sum(self.groundAreasTimesGrav) / sum(self.groundAreas)
+        groundAreasTimesGrav = self.groundAreas * self.groundRadii / rotationalRadius * inp.maxGravity
+        totalGround = np.sum(self.groundAreas)
+        if totalGround > 0:
+            self.averageGroundGravity = np.sum(groundAreasTimesGrav) / totalGround
         else:
             self.averageGroundGravity = self.groundRadii[0] / rotationalRadius * inp.maxGravity
 
-        self.extraHullArea = self.GroundArea(rotationalRadius)
-        self.hullAreasTimesGrav = [self.hullAreas[i] * self.floorRadii[i] / rotationalRadius * inp.maxGravity for i in range(len(self.hullAreas))]
-        self.hullAreasTimesGrav[0] += self.extraHullArea * inp.maxGravity
-        if sum(self.hullAreas) + self.extraHullArea > 0:
-            self.averageHullGravity = sum(self.hullAreasTimesGrav) / (sum(self.hullAreas) + self.extraHullArea)
+        self.extraHullArea = float(self.GroundArea(rotationalRadius))
+        hullAreasTimesGrav = self.hullAreas * self.floorRadii / rotationalRadius * inp.maxGravity
+        hullAreasTimesGrav[0] += self.extraHullArea * inp.maxGravity
+        totalHull = np.sum(self.hullAreas) + self.extraHullArea
+        if totalHull > 0:
+            self.averageHullGravity = np.sum(hullAreasTimesGrav) / totalHull
         else:
             self.averageHullGravity = self.hullAreas[0] / rotationalRadius * inp.maxGravity
 
+    def BinnedDistribution(self, radii, values, numberBins: int):
+        # aggregates floors into equal radius bins, preserving the sum of values and their first moment in radius
+        # (and thus the average gravity); returns the value-weighted bin radii and the bin values
+        bins = np.minimum((radii / self.rotationalRadius * numberBins).astype(int), numberBins - 1)
+        binValues = np.bincount(bins, weights=values, minlength=numberBins)
+        binMoments = np.bincount(bins, weights=values * radii, minlength=numberBins)
+        isFilled = binValues > 0
+        return binMoments[isFilled] / binValues[isFilled], binValues[isFilled]
+
     def NextFloorHeight(self, radius):
         return self.inp.constantFloorHeight + self.inp.variableFloorHeight * self.rotationalRadius / radius
 
+    # the following functions of the radius accept single radii or arrays of radii
+
     def GroundArea(self, radius):
+        radius = np.asarray(radius, dtype=float)
         if self.inp.shapeType == ShapeType.Cylinder:
             return 2 * math.pi * radius * self.inp.cylinderLengthToRotRadius * self.rotationalRadius
 
@@ -71,14 +76,12 @@ class Gravity:
             return self.TubeGroundArea(radius)
 
         elif self.inp.shapeType == ShapeType.Oblate:
-            return 4 * math.pi * radius * self.inp.oblateMinorToRotRadius * math.sqrt(self.rotationalRadius**2 - radius**2)
+            return 4 * math.pi * radius * self.inp.oblateMinorToRotRadius * np.sqrt(np.maximum(0, self.rotationalRadius**2 - radius**2))
 
         elif self.inp.shapeType == ShapeType.Torus:
             RH = self.inp.torusHabToRotRadius * self.rotationalRadius
-            if radius > self.rotationalRadius - 2 * RH:
-                return 4 * math.pi * radius * math.sqrt(RH**2 - (radius - self.rotationalRadius + RH)**2)
-            else:
-                return 0
+            return np.where(radius > self.rotationalRadius - 2 * RH,
+                            4 * math.pi * radius * np.sqrt(np.maximum(0, RH**2 - (radius - self.rotationalRadius + RH)**2)), 0)
 
         elif self.inp.shapeType in [ShapeType.Dumbbell, ShapeType.DumbbellTube]:
             result = self.DumbbellGroundArea(radius, isSmallerSphere=True) + self.DumbbellGroundArea(radius, isSmallerSphere=False)
@@ -86,11 +89,12 @@ class Gravity:
                 result += self.TubeGroundArea(radius)
             return result
 
-    def DumbbellGroundArea(self, radius: float, isSmallerSphere: bool):
+    def DumbbellGroundArea(self, radius, isSmallerSphere: bool):
         a_parallel, a_perp, a_parMin = self.DumbbellGroundHalfAxes(radius, isSmallerSphere)
         return (math.pi * (a_parallel - a_parMin) + 4 * a_parMin) * a_perp
 
     def HullOrientedLength(self, radius):
+        radius = np.asarray(radius, dtype=float)
         if self.inp.shapeType in [ShapeType.Dumbbell, ShapeType.DumbbellTube]:
             result = self.DumbbellHullLength(radius, isSmallerSphere=True) * self.DumbbellOrientationFactor(radius, isSmallerSphere=True) \
                 + self.DumbbellHullLength(radius, isSmallerSphere=False) * self.DumbbellOrientationFactor(radius, isSmallerSphere=False)
@@ -101,6 +105,7 @@ class Gravity:
             return self.HullLength(radius) * self.OrientationFactor(radius)
 
     def HullLength(self, radius):
+        radius = np.asarray(radius, dtype=float)
         if self.inp.shapeType == ShapeType.Cylinder:
             return 4 * math.pi * radius
 
@@ -112,48 +117,45 @@ class Gravity:
 
         elif self.inp.shapeType == ShapeType.Torus:
             RH = self.inp.torusHabToRotRadius * self.rotationalRadius
-            if radius > self.rotationalRadius - 2 * RH:
-                return 4 * math.pi * radius
-            else:
-                return 0
+            return np.where(radius > self.rotationalRadius - 2 * RH, 4 * math.pi * radius, 0)
 
-    def DumbbellHullLength(self, radius: float, isSmallerSphere: bool):
+    def DumbbellHullLength(self, radius, isSmallerSphere: bool):
+        radius = np.asarray(radius, dtype=float)
         a_parallel, a_perp, a_parMin = self.DumbbellGroundHalfAxes(radius, isSmallerSphere)
-        if a_parMin == 0:
-            return 2 * math.pi * math.sqrt((a_parallel ** 2 + a_perp ** 2) / 2)
-        else:
-            return 4 * a_perp * ((a_parallel - a_parMin) ** 2 + (2 * radius) ** 2) ** .5 / (2 * radius)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(a_parMin == 0, 2 * math.pi * np.sqrt((a_parallel ** 2 + a_perp ** 2) / 2),
+                            4 * a_perp * ((a_parallel - a_parMin) ** 2 + (2 * radius) ** 2) ** .5 / (2 * radius))
                     #2 * math.pi * math.sqrt(((a_parallel - a_parMin) ** 2 + a_perp ** 2) / 2)# 4 * a_perp * ((a_parallel - a_parMin) ** 2 + (2 * radius) ** 2) ** .5 / (2 * radius)
 
     def OrientationFactor(self, radius):
+        radius = np.asarray(radius, dtype=float)
         if self.inp.shapeType == ShapeType.Cylinder:
-            return 1
+            return np.ones_like(radius)
 
         elif self.inp.shapeType == ShapeType.Tube:
-            return 1
+            return np.ones_like(radius)
 
         elif self.inp.shapeType == ShapeType.Oblate:
-            return math.sqrt(1 + radius ** 2 * self.inp.oblateMinorToRotRadius ** 2 / (self.rotationalRadius ** 2 - radius ** 2))
+            with np.errstate(divide="ignore"):
+                return np.sqrt(1 + radius ** 2 * self.inp.oblateMinorToRotRadius ** 2 / (self.rotationalRadius ** 2 - radius ** 2))
 
         elif self.inp.shapeType == ShapeType.Torus:
             RH = self.inp.torusHabToRotRadius * self.rotationalRadius
-            if self.rotationalRadius - 2 * RH < radius < self.rotationalRadius:
-                return RH / math.sqrt(RH ** 2 - (radius - self.rotationalRadius + RH) ** 2)
-            else:
-                return 0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where((self.rotationalRadius - 2 * RH < radius) & (radius < self.rotationalRadius),
+                                RH / np.sqrt(RH ** 2 - (radius - self.rotationalRadius + RH) ** 2), 0)
 
-    def DumbbellOrientationFactor(self, radius: float, isSmallerSphere: bool):
+    def DumbbellOrientationFactor(self, radius, isSmallerSphere: bool):
+        radius = np.asarray(radius, dtype=float)
         RH, RR = self.DumbbellRadii(isSmallerSphere)
-        if radius < RR - 2 * RH or radius > RR:
-            return 0
         a_parallel, a_perp, a_parMin = self.DumbbellGroundHalfAxes(radius, isSmallerSphere)
-        if radius > 2 * RH - RR:
+        with np.errstate(divide="ignore", invalid="ignore"):
             cos_beta = (radius ** 2 + RH ** 2 - (RR - RH) ** 2) / (2 * radius * RH)
-            sin_beta = math.sqrt(1 - cos_beta ** 2)
+            sin_beta = np.sqrt(np.maximum(0, 1 - cos_beta ** 2))
             a_parEff = RH * sin_beta
-            return 2 * RH / (a_parallel + a_parEff)
-        else:
-            return 2 * RH / (a_parallel + a_parMin)
+            denominator = np.where(radius > 2 * RH - RR, a_parallel + a_parEff, a_parallel + a_parMin)
+            result = np.where(denominator > 0, 2 * RH / denominator, 0)  # no hull at the very edge of the sphere
+        return np.where((radius < RR - 2 * RH) | (radius > RR), 0, result)
 
     def DumbbellRadii(self, isSmallerSphere: bool):
         if isSmallerSphere:
@@ -164,40 +166,38 @@ class Gravity:
             RR = self.oppositeRotationalRadius
         return RH, RR
 
-    def DumbbellGroundHalfAxes(self, radius: float, isSmallerSphere: bool):
+    def DumbbellGroundHalfAxes(self, radius, isSmallerSphere: bool):
+        radius = np.asarray(radius, dtype=float)
         RH, RR = self.DumbbellRadii(isSmallerSphere)
-        if radius < RR - 2 * RH or radius >= RR:
-            return 0, 0, 0
-        a_parallel = math.sqrt(RH ** 2 - (radius - RR + RH) ** 2)
-        if radius > 2 * RH - RR:
+        isOutside = (radius < RR - 2 * RH) | (radius >= RR)
+        isOuterPart = radius > 2 * RH - RR
+        a_parallel = np.sqrt(np.maximum(0, RH ** 2 - (radius - RR + RH) ** 2))
+        with np.errstate(divide="ignore", invalid="ignore"):
             cos_alpha = (radius ** 2 + RR ** 2 - 2 * RR * RH) / (2 * radius * (RR - RH))
-            a_perp = radius * math.acos(cos_alpha)
-            a_parMin = 0
-        else:
-            a_perp = math.pi * radius
-            a_parMin = math.sqrt(RH ** 2 - (radius + RR - RH) ** 2)
-        return a_parallel, a_perp, a_parMin
+            a_perp = np.where(isOuterPart, radius * np.arccos(np.clip(cos_alpha, -1, 1)), math.pi * radius)
+        a_parMin = np.where(isOuterPart, 0, np.sqrt(np.maximum(0, RH ** 2 - (radius + RR - RH) ** 2)))
+        return np.where(isOutside, 0, a_parallel), np.where(isOutside, 0, a_perp), np.where(isOutside, 0, a_parMin)
 
-    def TubeGroundArea(self, radius: float):
+    def TubeGroundArea(self, radius):
+        radius = np.asarray(radius, dtype=float)
         RT = self.inp.tubeRadiusToRotRadius * self.rotationalRadius
-        result = 0
+        result = np.zeros_like(radius)
+        with np.errstate(divide="ignore"):
+            area = np.where(radius < RT, math.pi * radius * (RT + np.sqrt(np.maximum(0, RT ** 2 - radius ** 2))),
+                            math.pi * radius * RT * np.arcsin(np.minimum(1, RT / radius)))
         for innerRadius, outerRadius in self.TubeMinMaxRadii():
-            if innerRadius < radius <= outerRadius:
-                if radius < RT:
-                    result += math.pi * radius * (RT + math.sqrt(RT ** 2 - radius ** 2))
-                else:
-                    result += math.pi * radius * RT * math.asin(RT / radius)
+            result = result + np.where((innerRadius < radius) & (radius <= outerRadius), area, 0)
         return result
 
-    def TubeHullLength(self, radius: float):
+    def TubeHullLength(self, radius):
+        radius = np.asarray(radius, dtype=float)
         RT = self.inp.tubeRadiusToRotRadius * self.rotationalRadius
-        result = 0
+        result = np.zeros_like(radius)
+        with np.errstate(divide="ignore"):
+            length = np.where(radius < RT, 2 * math.pi * np.sqrt((radius ** 2 + (RT * np.arcsin(np.minimum(1, radius / RT))) ** 2) / 2),
+                              2 * math.pi * np.sqrt((RT ** 2 + (radius * np.arcsin(np.minimum(1, RT / radius))) ** 2) / 2))
         for innerRadius, outerRadius in self.TubeMinMaxRadii():
-            if innerRadius < radius <= outerRadius:
-                if radius < RT:
-                    result += 2 * math.pi * math.sqrt((radius ** 2 + (RT * math.asin(radius / RT)) ** 2) / 2)
-                else:
-                    result += 2 * math.pi * math.sqrt((RT ** 2 + (radius * math.asin(RT / radius)) ** 2) / 2)
+            result = result + np.where((innerRadius < radius) & (radius <= outerRadius), length, 0)
         return result
 
     def TubeMinMaxRadii(self):  # [minRadius, maxRadius], [otherMinRadius, otherMaxRadius]
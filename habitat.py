@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 from absorption import Absorption
 from connection import Connection
 from emission import Emission
@@ -13,17 +15,20 @@ from structure import Structure
 
 
 class Habitat:
-
-    def __init__(self, inp: Input, habPower, absFriction, conFriction, emFriction, hullPowerPerSurface=None):
+    __slots__ = ("iRun", "habPower", "population", "shape", "effectiveHabRadius", "effectiveHabLength", "hullPowerPerSurface", "electricFraction",
+                 "lightPower", "lightCollection", "isCompleteLighting", "lightingReport", "outsidePower", "insidePower", "hullPower", "coolingPower",
+                 "absFriction", "conFriction", "emFriction", "absorption", "emission", "connection", "isCoolingPossible", "coolingReport",
+                 "electricCoolingPower", "electricMassPerPower", "electricCoolingMass", "electricHabMass", "electricPower", "electricArea",
+                 "electricMass", "collectionRadius", "lightRadius", "totalCoolingMass", "gravity", "totalInnerMass", "structure", "totalMass",
+                 "frictionIterations", "frictionEvaluations")
+
+    def __init__(self, inp: Input, habPower, absFriction, conFriction, emFriction, hullPowerPerSurface=None, isStructureComputed=True):
         self.iRun = inp.iRun
 
         self.habPower = habPower
         self.population = habPower / inp.powerPerPerson
-        self.absFriction = absFriction
-        self.conFriction = conFriction
-        self.emFriction = emFriction
 
-        self.shape = Shape(inp, self.population * inp.volumePerPerson)
+        self.shape = Shape.getForVolume(inp, self.population * inp.volumePerPerson)
 
         self.effectiveHabRadius = (self.shape.crossSection / math.pi) ** .5
         self.effectiveHabLength = self.shape.habVolume / self.shape.crossSection
@@ -31,7 +36,7 @@ class Habitat:
         if hullPowerPerSurface is not None:
             self.hullPowerPerSurface = hullPowerPerSurface
         else:
-            self.hullPowerPerSurface = HullTransfer(inp, self.shape.crossSection / self.shape.hullSurface).powerPerSurface
+            self.hullPowerPerSurface = HullTransfer.getPowerPerSurface(inp, self.shape.crossSection / self.shape.hullSurface)
 
         # Light
         self.electricFraction = inp.electricFraction
@@ -62,6 +67,15 @@ class Habitat:
         self.hullPower = min(self.insidePower, self.hullPowerPerSurface * (self.shape.hullSurface - self.lightCollection.windowArea) )
         self.coolingPower = self.insidePower - self.hullPower + self.lightCollection.windowCoolingPower
 
+        self.computeCooling(inp, absFriction, conFriction, emFriction)
+        if isStructureComputed:
+            self.computeStructure(inp)
+
+    def computeCooling(self, inp: Input, absFriction, conFriction, emFriction):  # can be repeated for other friction fractions
+        self.absFriction = absFriction
+        self.conFriction = conFriction
+        self.emFriction = emFriction
+
         self.absorption = Absorption(inp, self.coolingPower, absFriction, conFriction, emFriction, self.effectiveHabRadius, self.shape.habVolume)
         self.absFriction = self.absorption.absorptionFrictionPower / max(1e-10, self.coolingPower)
 
@@ -93,24 +107,30 @@ class Habitat:
         self.totalCoolingMass = self.absorption.absorptionCoolantMass + self.connection.connectionCoolantMass + self.emission.emissionCoolantMass \
             + self.absorption.absorptionSurfaceMass + self.connection.connectionSurfaceMass + self.emission.emissionSurfaceMass + self.electricCoolingMass
 
+    def computeStructure(self, inp: Input):
         if inp.shapeType in [ShapeType.Dumbbell, ShapeType.DumbbellTube]:
             self.gravity = Gravity(inp, self.shape.rotationalRadius, self.shape.oppositeRotationalRadius)
         else:
             self.gravity = Gravity(inp, self.shape.rotationalRadius)
+        groundRadii, groundAreas = self.gravity.groundRadii, self.gravity.groundAreas
+        hullRadii, hullAreas = self.gravity.floorRadii, self.gravity.hullAreas
+        if 0 < inp.numberGravityBins < len(groundRadii):  # floors aggregated for the structural computation
+            groundRadii, groundAreas = self.gravity.BinnedDistribution(groundRadii, groundAreas, inp.numberGravityBins)
+            hullRadii, hullAreas = self.gravity.BinnedDistribution(hullRadii, hullAreas, inp.numberGravityBins)
         totalGround = sum(self.gravity.groundAreas)
         self.totalInnerMass = self.shape.interiorMass + self.absorption.absorptionSurfaceMass + self.absorption.absorptionCoolantMass
-        if totalGround > 0:
-            groundDistribution = {self.gravity.groundRadii[i]: self.gravity.groundAreas[i] / totalGround * self.totalInnerMass for i in range(len(self.gravity.groundRadii)) }
+        if totalGround > 0:  # (radii, masses)
+            groundDistribution = groundRadii, groundAreas / totalGround * self.totalInnerMass
         else:
-            groundDistribution = {self.gravity.groundRadii[0]: self.totalInnerMass}
+            groundDistribution = [self.gravity.groundRadii[0]], [self.totalInnerMass]
         totalHull = sum(self.gravity.hullAreas) + self.gravity.extraHullArea
         if totalHull > 0:
-            hullDistribution = {self.gravity.floorRadii[i]: self.gravity.hullAreas[i] / totalHull * self.shape.hullMass for i in range(len(self.gravity.groundRadii)) }
-            hullDistribution[self.shape.rotationalRadius] = self.gravity.extraHullArea / totalHull * self.shape.hullMass
+            hullDistribution = np.append(hullRadii, self.shape.rotationalRadius), \
+                np.append(hullAreas, self.gravity.extraHullArea) / totalHull * self.shape.hullMass
         else:
-            hullDistribution = {self.gravity.floorRadii[0]: self.shape.hullMass}
+            hullDistribution = [self.gravity.floorRadii[0]], [self.shape.hullMass]
 
-        self.structure = Structure(inp, rotationalRadius=self.shape.rotationalRadius, pressuredVolume=self.shape.habVolume + self.connection.connectionVolume + self.emission.emissionVolume,
+        self.structure = Structure(inp, N=inp.numberSupportShells, rotationalRadius=self.shape.rotationalRadius, pressuredVolume=self.shape.habVolume + self.connection.connectionVolume + self.emission.emissionVolume,
                                 pressuredMass=self.shape.airMass + self.connection.connectionCoolantMass + self.emission.emissionCoolantMass,
                                 groundDistribution=groundDistribution, hullDistribution=hullDistribution,
                                 radiatorRadius=self.emission.emissionRadius, lightRadius=self.lightRadius, electricRadius=self.collectionRadius,
@@ -3,6 +3,10 @@
 import enum
 import math
 
+import numpy as np
+
+from snapshot import fieldValues
+
 
 class ShapeType(enum.Enum):
     Cylinder = 0
@@ -19,8 +23,24 @@ class CoolantType(enum.Enum):
     Air = 2
 
 
+class SolverType(enum.Enum):
+    Damped = 0
+    Brent = 1
+
+
+class OptimizerType(enum.Enum):
+    SingleStep = 0
+    Iterated = 1
+
+
 class CoolingHelper:
+    # input parameters that determine the coolant properties
+    inputFields = ("coolantType", "maxHabTemp", "minHabTemp", "tempDiffFlow", "minTempDiffHabCoolant",
+                   "outgoingRelativeHumidity", "liquidDensity", "liquidHeatCapacity", "vaporLatentHeat", "airPressure",
+                   "innerSurfacePerPower", "absorptionTransferCoeff")
+
     def __init__(self, inp):
+        self.parameters = fieldValues(inp, self.inputFields)
         if inp.coolantType == CoolantType.Air:
             self.outgoingTemp = inp.maxHabTemp
             self.incomingTemp = inp.minHabTemp
@@ -60,27 +80,116 @@ class CoolingHelper:
                                                 * math.log(maxTempDiffHabCoolant / inp.minTempDiffHabCoolant)
             else:
                 self.absorptionSurfacePerPower = 1 / inp.absorptionTransferCoeff / maxTempDiffHabCoolant
+
+    @classmethod
+    def getForInput(cls, inp):  # instance shared via the input, rebuilt only if its input parameters have changed
+        coolingHelper = getattr(inp, "coolingHelper", None)
+        if coolingHelper is None or coolingHelper.parameters != fieldValues(inp, cls.inputFields):
+            coolingHelper = cls(inp)
+            inp.coolingHelper = coolingHelper
+        return coolingHelper
     
 
-def LogRange(numberOfModels, minValue, maxValue):
+def LogRange(numberOfModels, minValue, maxValue):  # list of logarithmically spaced values (exact end points)
     if numberOfModels == 1:
         return [minValue]
-    dLog = (math.log(maxValue) - math.log(minValue)) / (numberOfModels - 1)
-    logValue = math.log(minValue)
-    values = []
-    for i in range(numberOfModels):
-        values.append(math.exp(logValue))
-        logValue += dLog
-    return values
+    values = np.exp(np.linspace(math.log(minValue), math.log(maxValue), numberOfModels))
+    values[0], values[-1] = minValue, maxValue
+    return values.tolist()
 
 
-def frictionFactor(reynolds, minFrictionFactor):
-    if reynolds == 0:
-        return 1e-10
-    elif reynolds < 2300:
-        return 64 / reynolds
-    else:
-        return max(minFrictionFactor, 0.3164 * reynolds ** (-1 / 4))
+def frictionFactor(reynolds, minFrictionFactor):  # reynolds can be a number or an array
+    if np.ndim(reynolds) == 0:  # (faster without numpy for a single habitat)
+        if reynolds == 0:
+            return 1e-10
+        elif reynolds < 2300:
+            return 64 / reynolds
+        else:
+            return max(minFrictionFactor, 0.3164 * reynolds ** (-1 / 4))
+    reynolds = np.asarray(reynolds, dtype=float)
+    with np.errstate(divide="ignore"):
+        laminar = 64 / reynolds
+        turbulent = np.maximum(minFrictionFactor, 0.3164 * reynolds ** (-1 / 4))
+    return np.where(reynolds == 0, 1e-10, np.where(reynolds < 2300, laminar, turbulent))
 
 
+def brentRoot(function, a, b, relativeTolerance, maxIterations=100):
+    # root of function between a and b (with a sign change) by Brent's method; returns root and number of evaluations
+    fa, fb = function(a), function(b)
+    numberEvaluations = 2
+    if fa == 0:
+        return a, numberEvaluations
+    if fa * fb > 0:
+        raise ValueError("Root is not bracketed")
+    c, fc = a, fa
+    d = e = b - a
+    for i in range(maxIterations):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tolerance = 2e-16 * abs(b) + relativeTolerance * abs(b) / 2 + 1e-300
+        m = (c - b) / 2
+        if abs(m) <= tolerance or fb == 0:
+            return b, numberEvaluations
+        if abs(e) >= tolerance and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:  # secant
+                p = 2 * m * s
+                q = 1 - s
+            else:  # inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tolerance * q), abs(e * q)):
+                e, d = d, p / q
+            else:  # bisection
+                d = e = m
+        else:  # bisection
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tolerance else (tolerance if m > 0 else -tolerance)
+        fb = function(b)
+        numberEvaluations += 1
+    return b, numberEvaluations
+
 
+def adaptiveSimpson(function, a, b, relativeTolerance, maxDepth=30):
+    # integral of a vectorized function from a to b, halving the intervals where Simpson's rule has not converged
+    # returns integral, estimated absolute error and number of evaluations
+    x = np.linspace(a, b, 3)
+    fx = function(x)
+    lefts, rights = x[:1], x[2:]
+    fLefts, fMids, fRights = fx[:1], fx[1:2], fx[2:]
+    wholes = (rights - lefts) / 6 * (fLefts + 4 * fMids + fRights)
+    numberEvaluations = 3
+    integral = error = 0
+    for depth in range(maxDepth + 1):
+        mids = (lefts + rights) / 2
+        fQuarters = function(np.concatenate([(lefts + mids) / 2, (mids + rights) / 2]))
+        numberEvaluations += len(fQuarters)
+        fLeftQuarters, fRightQuarters = fQuarters[:len(lefts)], fQuarters[len(lefts):]
+        leftHalves = (mids - lefts) / 6 * (fLefts + 4 * fLeftQuarters + fMids)
+        rightHalves = (rights - mids) / 6 * (fMids + 4 * fRightQuarters + fRights)
+        differences = leftHalves + rightHalves - wholes
+        estimate = abs(integral + np.sum(leftHalves + rightHalves))
+        isConverged = np.abs(differences) <= 15 * relativeTolerance * estimate * (rights - lefts) / (b - a)
+        if depth == maxDepth:
+            isConverged[:] = True
+        integral += np.sum(leftHalves[isConverged] + rightHalves[isConverged] + differences[isConverged] / 15)  # Richardson
+        error += np.sum(np.abs(differences[isConverged])) / 15
+        refine = ~isConverged
+        if not np.any(refine):
+            break
+        lefts, rights = np.concatenate([lefts[refine], mids[refine]]), np.concatenate([mids[refine], rights[refine]])
+        fLefts, fRights = np.concatenate([fLefts[refine], fMids[refine]]), np.concatenate([fMids[refine], fRights[refine]])
+        fMids = np.concatenate([fLeftQuarters[refine], fRightQuarters[refine]])
+        wholes = np.concatenate([leftHalves[refine], rightHalves[refine]])
+    return integral, error, numberEvaluations
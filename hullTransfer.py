@@ -1,37 +1,94 @@
+from collections import OrderedDict
+
+import helpers
 from input import Input
+from snapshot import fieldValues
 
 
 class HullTransfer:
-    def __init__(self, inp: Input, crossSectionToHullSurface: float):
-        hullResistance = inp.hullSurfaceDensity / inp.hullDensity / inp.hullConductivity
-        lastPowerPerSurface = 0
-        newPowerPerSurface = 100
-        dampening = 1 / 5
-        while abs(newPowerPerSurface - lastPowerPerSurface) > 0.1:
-            self.powerPerSurface = lastPowerPerSurface + (newPowerPerSurface - lastPowerPerSurface) * dampening
-            lastPowerPerSurface = self.powerPerSurface
-
-            innerHullTemp = inp.minHabTemp - self.powerPerSurface / inp.absorptionTransferCoeff
-
-            innerGapTemp = innerHullTemp - self.powerPerSurface * inp.gapLocation * hullResistance
-
-            if inp.gapThickness > 0:
-                # radiative heat transfer [W/m**2K] (if outerGapTemp 1K lower than innerGapTemp)
-                radiativeResistance, effectiveEmissivity, numberReflections = \
-                    self.gapRadiation(innerGapTemp, innerGapTemp - 1, inp.innerGapEmissivity, inp.outerGapEmissivity)
-                outerGapTemp = innerGapTemp - self.powerPerSurface \
-                               / (inp.gapTransferCoeff / 2 + inp.gapConductivity / inp.gapThickness + 1 / radiativeResistance)
-            else:
-                outerGapTemp = innerGapTemp
+    # input parameters that determine the hull transfer (besides crossSectionToHullSurface)
+    inputFields = ("hullSurfaceDensity", "hullDensity", "hullConductivity", "hullSurfaceAbsorptivity",
+                   "gapThickness", "gapLocation", "innerGapEmissivity", "outerGapEmissivity", "gapTransferCoeff",
+                   "gapConductivity", "minHabTemp", "absorptionTransferCoeff", "emissivity", "skyTemp",
+                   "solarDistance", "shadedFraction", "hullSolver", "hullRelativeTolerance", "isGapRadiationExact")
+    cache = OrderedDict()  # {(input parameters, crossSectionToHullSurface): powerPerSurface}, least recently used first
+    cacheSize = 1000  # maximum number of cached results
+    ratioDigits = 6  # significant digits of crossSectionToHullSurface in the cache key
+    isWarmStarted = False  # if new results start from the cached one with the same input parameters and nearest ratio
+                           # (results then depend on the order of computation, within the tolerance)
+
+    def __init__(self, inp: Input, crossSectionToHullSurface: float, startPowerPerSurface: float = 20):
+        self.inp = inp
+        self.crossSectionToHullSurface = crossSectionToHullSurface
+        self.hullResistance = inp.hullSurfaceDensity / inp.hullDensity / inp.hullConductivity
+        if inp.hullSolver == helpers.SolverType.Brent:
+            # the transmitted power decreases with the power through the hull, so the balance is bracketed
+            # between zero and the transmitted power at zero
+            maxPowerPerSurface = self.transmittedPower(0)
+            self.powerPerSurface, self.numberIterations = helpers.brentRoot(
+                lambda powerPerSurface: self.transmittedPower(powerPerSurface) - powerPerSurface,
+                0, maxPowerPerSurface, inp.hullRelativeTolerance)
+            self.numberIterations += 1  # number of evaluations of the transmitted power
+        else:  # Damped
+            dampening = 1 / 5
+            self.powerPerSurface = startPowerPerSurface
+            self.numberIterations = 0
+            while True:
+                self.numberIterations += 1
+                newPowerPerSurface = self.transmittedPower(self.powerPerSurface)
+                if abs(newPowerPerSurface - self.powerPerSurface) <= 0.1:
+                    break
+                self.powerPerSurface += (newPowerPerSurface - self.powerPerSurface) * dampening
+        # powerPerSurface: transmitted power per surface [W/m**2]
+
+    def transmittedPower(self, powerPerSurface):  # power per surface emitted by the hull for a given power through it
+        inp = self.inp
+        innerHullTemp = inp.minHabTemp - powerPerSurface / inp.absorptionTransferCoeff
+
+        innerGapTemp = innerHullTemp - powerPerSurface * inp.gapLocation * self.hullResistance
+
+        if inp.gapThickness > 0:
+            # radiative heat transfer [W/m**2K] (if outerGapTemp 1K lower than innerGapTemp)
+            radiativeResistance, effectiveEmissivity, numberReflections = \
+                self.gapRadiation(innerGapTemp, innerGapTemp - 1, inp.innerGapEmissivity, inp.outerGapEmissivity, inp.isGapRadiationExact)
+            outerGapTemp = innerGapTemp - powerPerSurface \
+                           / (inp.gapTransferCoeff / 2 + inp.gapConductivity / inp.gapThickness + 1 / radiativeResistance)
+        else:
+            outerGapTemp = innerGapTemp
+
+        surfaceTemp = max(inp.skyTemp, outerGapTemp - powerPerSurface * (1 - inp.gapLocation) * self.hullResistance)
+
+        return max(0, 5.67e-8 * inp.emissivity * surfaceTemp ** 4
+                   - inp.emissivity * 5.67e-8 * inp.skyTemp ** 4
+                   - inp.getIrradiation() * inp.hullSurfaceAbsorptivity * self.crossSectionToHullSurface)
+
+    @classmethod
+    def getPowerPerSurface(cls, inp: Input, crossSectionToHullSurface: float):  # with memoization of converged results
+        parameters = fieldValues(inp, cls.inputFields)
+        ratio = float("%.*g" % (cls.ratioDigits, crossSectionToHullSurface))
+        key = (parameters, ratio)
+        if key in cls.cache:
+            cls.cache.move_to_end(key)
+            return cls.cache[key]
+
+        startPowerPerSurface = 20
+        if cls.isWarmStarted:
+            nearestKeys = [oldKey for oldKey in cls.cache if oldKey[0] == parameters]
+            if len(nearestKeys) > 0:
+                startPowerPerSurface = cls.cache[min(nearestKeys, key=lambda oldKey: abs(oldKey[1] - ratio))]
 
-            surfaceTemp = max(inp.skyTemp, outerGapTemp - self.powerPerSurface * (1 - inp.gapLocation) * hullResistance)
+        powerPerSurface = HullTransfer(inp, ratio, startPowerPerSurface).powerPerSurface
+        cls.cache[key] = powerPerSurface
+        if len(cls.cache) > cls.cacheSize:
+            cls.cache.popitem(last=False)
+        return powerPerSurface
 
-            newPowerPerSurface = max(0, 5.67e-8 * inp.emissivity * surfaceTemp ** 4
-                                     - inp.emissivity * 5.67e-8 * inp.skyTemp ** 4
-                                     - inp.getIrradiation() * inp.hullSurfaceAbsorptivity * crossSectionToHullSurface)
-        # return powerPerSurface  # transmitted power per surface [W/m**2]
+    def gapRadiation(self, T1, T2, e1, e2, isExact=False):
+        if isExact:  # sum of the inter-reflection series of two grey parallel plates (also for arrays of temperatures)
+            effectiveEmissivity = 1 / (1 / e1 + 1 / e2 - 1)
+            p = effectiveEmissivity * 5.67e-8 * (T1 ** 4 - T2 ** 4)
+            return (T1 - T2) / p, effectiveEmissivity, 0
 
-    def gapRadiation(self, T1, T2, e1, e2):
         r1, r2 = 1 - e1, 1 - e2
         i1 = e1 * 5.67e-8 * T1 ** 4
         i2 = -e2 * 5.67e-8 * T2 ** 4
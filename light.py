@@ -3,6 +3,9 @@ import math
 
 
 class LightCollection:
+    __slots__ = ("maxAngularDeviation", "lightChannelSurface", "lightAbsPower", "windowPower", "lightCollectionArea", "windowArea", "lightMass",
+                 "windowTemperature", "windowCoolingPower", "windowToHabPower", "lightVolume", "isUnconcentratedLightingPossible")
+
     def __init__(self, inp: Input, lightPower, habRadius, crossSection):
         self.maxAngularDeviation = inp.concentrationFactor ** .5 * 7 / 1.5e3 / inp.solarDistance
         self.lightChannelSurface = lightPower / inp.surfaceIntensity
@@ -0,0 +1,166 @@
+# the sizes at which the limits of a habitat design are reached are detected here, either in one pass over a stream of sizes
+# or at once on the columns of a sweep, optionally located more precisely by additional habitats between the sizes
+
+import math
+
+import numpy as np
+
+from results import SweepResults
+
+
+def getSize(values):
+    return "pop. %.1e / %.1e m³ / %.1e W" % (values["population"], values["shape.habVolume"], values["habPower"])
+
+
+def getReport(report):  # (not available from columns)
+    return "" if report is None else " - " + report
+
+
+class HabitatValues:  # quantities of a habitat by their column names, e.g. "shape.hullMass"
+    __slots__ = ("hab",)
+
+    def __init__(self, hab):
+        self.hab = hab
+
+    def __getitem__(self, name: str):
+        value = self.hab
+        for attribute in name.split("."):
+            value = getattr(value, attribute, None)  # e.g. no coolingReport if cooling is possible
+        return value
+
+
+class ColumnValues:  # quantities of one size of a sweep by their column names
+    __slots__ = ("results", "index")
+
+    def __init__(self, results: SweepResults, index: int):
+        self.results = results
+        self.index = index
+
+    def __getitem__(self, name: str):
+        return self.results[name][self.index] if name in self.results else None
+
+
+# (name, if reached, message), in the order of printing; each limit is reported at the first size at which it is reached
+# (the conditions are evaluated for a single size as well as for whole columns)
+limits = [("hullMass", lambda v: v["shape.hullMass"] < v["shape.interiorMass"],
+           lambda v: "Hull mass is larger than interior mass (%.1e kg) below %s" % (v["shape.interiorMass"], getSize(v))),
+          ("rotationRate", lambda v: v["structure.rotationRate_rpm"] < 3,
+           lambda v: "Rotational rate is larger than 3rpm below " + getSize(v)),
+          ("naturalCooling", lambda v: v["insidePower"] > v["hullPower"],
+           lambda v: "No natural cooling above " + getSize(v)),
+          ("cooling", lambda v: np.logical_not(v["isCoolingPossible"]),
+           lambda v: "No complete cooling above " + getSize(v) + getReport(v["coolingReport"])),
+          ("electricCoRotation", lambda v: v["structure.coRotationalElectricFraction"] < 1,
+           lambda v: "No complete co-rotation of PV above " + getSize(v)),
+          ("lightCoRotation", lambda v: v["structure.coRotationalLightFraction"] < 1,
+           lambda v: "No complete co-rotation of mirrors above " + getSize(v)),
+          ("lighting", lambda v: np.logical_not(v["isCompleteLighting"]),
+           lambda v: "No complete lighting above " + getSize(v) + getReport(v["lightingReport"])),
+          ("coRotationalRadius", lambda v: v["shape.rotationalRadius"] > v["structure.coRotationalRadius"],
+           lambda v: "Rotational radius surpasses critical co-rotational radius at pop. %.1e / %.1e m  %.1e m³ / %.1e W"
+                     % (v["population"], v["shape.rotationalRadius"], v["shape.habVolume"], v["habPower"])),
+          ("coolingMass", lambda v: v["totalCoolingMass"] > v["shape.interiorMass"],
+           lambda v: "Cooling mass surpasses the interior mass at " + getSize(v)),
+          ("structuralHullMass", lambda v: v["structure.totalStructuralMass"] > v["shape.hullMass"],
+           lambda v: "Structural mass surpasses hull mass at " + getSize(v)),
+          ("structuralInteriorMass", lambda v: v["structure.totalStructuralMass"] > v["shape.interiorMass"],
+           lambda v: "Structural mass surpasses the interior mass at " + getSize(v))]
+
+
+def getInteriorMassFraction(values):
+    return values["shape.interiorMass"] / values["totalMass"]
+
+
+def getInteriorMassMessage(values):
+    return "Maximum interior mass fraction (%.3f) / minimum mass per volume at %s" % (getInteriorMassFraction(values), getSize(values))
+
+
+class LimitDetector:  # incremental, for one size after the other
+    def __init__(self):
+        self.messages = {}  # {limit name: message}
+        self.lastInteriorMassFraction = 0
+        self.lastInteriorMassMessage = None
+        self.interiorMassMessage = None  # at the maximum interior mass fraction, once it decreases
+
+    def update(self, values):  # for the next size (values e.g. HabitatValues)
+        for name, isReached, getMessage in limits:
+            if name not in self.messages and isReached(values):
+                self.messages[name] = getMessage(values)
+        if self.interiorMassMessage is None:
+            interiorMassFraction = getInteriorMassFraction(values)
+            if interiorMassFraction < self.lastInteriorMassFraction:
+                self.interiorMassMessage = self.lastInteriorMassMessage
+            else:
+                self.lastInteriorMassFraction = interiorMassFraction
+                self.lastInteriorMassMessage = getInteriorMassMessage(values)
+
+    def getMessages(self):
+        messages = [self.messages[name] for name, isReached, getMessage in limits if name in self.messages]
+        if self.interiorMassMessage is not None:
+            messages.append(self.interiorMassMessage)
+        return messages
+
+
+def findLimits(results: SweepResults, habitats=None, computeHabitat=None, relativeTolerance=1e-3):
+    # messages of the limits of a sweep, from comparisons of whole columns; with computeHabitat(population), each limit
+    # is located between the two sizes around it to relativeTolerance of the population, by additional habitats
+    def getValues(index):
+        return ColumnValues(results, index) if habitats is None else HabitatValues(habitats[index])
+
+    pops = results["population"]
+    messages = []
+    for name, isReached, getMessage in limits:
+        try:
+            isReachedColumn = np.asarray(isReached(results), dtype=bool)
+        except KeyError:  # quantity not computed (batch computation)
+            continue
+        if not np.any(isReachedColumn):
+            continue
+        index = int(np.argmax(isReachedColumn))
+        values = getValues(index)
+        if computeHabitat is not None and index > 0:
+            hab = bisectLimit(lambda hab: isReached(HabitatValues(hab)), computeHabitat, pops[index - 1], pops[index], relativeTolerance)
+            if hab is not None:
+                values = HabitatValues(hab)
+        messages.append(getMessage(values))
+
+    if "totalMass" not in results:
+        return messages
+    isDecreasing = np.diff(getInteriorMassFraction(results)) < 0
+    if np.any(isDecreasing):
+        index = int(np.argmax(isDecreasing))  # last size before the first decrease
+        values = getValues(index)
+        if computeHabitat is not None and index > 0:
+            values = HabitatValues(maximizeInteriorMassFraction(computeHabitat, pops[index - 1], pops[index + 1], relativeTolerance))
+        messages.append(getInteriorMassMessage(values))
+    return messages
+
+
+def bisectLimit(isReached, computeHabitat, lowerPop, upperPop, relativeTolerance):
+    # the habitat at the smallest population found for which the limit is reached (None if it is only reached at upperPop)
+    upperHab = None
+    while upperPop / lowerPop > 1 + relativeTolerance:
+        pop = (lowerPop * upperPop) ** .5
+        hab = computeHabitat(pop)
+        if isReached(hab):
+            upperPop, upperHab = pop, hab
+        else:
+            lowerPop = pop
+    return upperHab
+
+
+def maximizeInteriorMassFraction(computeHabitat, lowerPop, upperPop, relativeTolerance):  # golden-section search in log population
+    invPhi = (5 ** .5 - 1) / 2
+    a, b = math.log(lowerPop), math.log(upperPop)
+    c, d = b - invPhi * (b - a), a + invPhi * (b - a)
+    habC, habD = computeHabitat(math.exp(c)), computeHabitat(math.exp(d))
+    while b - a > math.log(1 + relativeTolerance):
+        if getInteriorMassFraction(HabitatValues(habC)) > getInteriorMassFraction(HabitatValues(habD)):
+            b, d, habD = d, c, habC
+            c = b - invPhi * (b - a)
+            habC = computeHabitat(math.exp(c))
+        else:
+            a, c, habC = c, d, habD
+            d = a + invPhi * (b - a)
+            habD = computeHabitat(math.exp(d))
+    return habC if getInteriorMassFraction(HabitatValues(habC)) > getInteriorMassFraction(HabitatValues(habD)) else habD
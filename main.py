@@ -2,31 +2,9 @@
 import argparse
 import os
 
-from hullTransfer import HullTransfer
-from shape import Shape
 from input import Input
 from output import Output
-from habitat import Habitat
-import optimizer
-
-
-def computeSizes():
-    pops = inp.population
-    if inp.population.__class__ is not list:
-        pops = [inp.population]
-        print("population %.1e, power %.2e W, volume %.2e m³" % (inp.population, inp.population * inp.powerPerPerson, inp.population * inp.volumePerPerson))
-
-    tempShape = Shape(inp, pops[0] * inp.powerPerPerson)
-    hullPowerPerSurface = HullTransfer(inp, tempShape.crossSection / tempShape.hullSurface).powerPerSurface
-    results = []
-    for pop in pops:
-        power = pop * inp.powerPerPerson
-        if inp.isFrictionOptimized:
-            results.append( optimizer.getOptimizedResult(inp, power, hullPowerPerSurface))
-        else:
-            results.append( Habitat(inp, power, inp.absorptionFrictionFraction, inp.connectionFrictionFraction,
-                                    inp.emissionFrictionFraction, hullPowerPerSurface) )
-    return results
+import runner
 
 
 if __name__ == '__main__':
@@ -35,6 +13,7 @@ if __name__ == '__main__':
     parser.add_argument("--population", type=float, help="a single size, specified by population", default=None)
     parser.add_argument("--volume", type=float, help="a single habitat volume in m³", default=None)
     parser.add_argument("--power", type=float, help="a single habitat power in W", default=None)
+    parser.add_argument("--headless", action="store_true", help="no figures (matplotlib is not imported), results written as tables into the project directory")
 
     s = "Input in input.py"
 
@@ -56,13 +35,14 @@ if __name__ == '__main__':
     os.system("mkdir " + inp.project)
     os.system("copy input.py " + inp.project)
 
-    runResults = []
-    for iRun in range(inp.numberRuns):
-        if inp.numberRuns > 1:
-            inp.changeParameters(iRun)
-            print("Computing model number %i (%s)..." % (iRun, inp.label[iRun]))
-        else:
-            print("Computing model " + inp.project+"...")
-        runResults.append(computeSizes())
-
-    Output(inp, runResults)
+    if inp.isResultStreamed:  # no results kept for output
+        detectors = runner.computeRuns(inp, runner.streamSizes)
+        for iRun, detector in enumerate(detectors):
+            if inp.numberRuns > 1:
+                print("\n" + inp.label[iRun] + ":")
+            for message in detector.getMessages():
+                print(message)
+    else:
+        runResults = runner.computeRuns(inp)
+        Output.isHeadless = Output.isHeadless or args.headless
+        Output(inp, runResults)
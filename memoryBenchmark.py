@@ -0,0 +1,28 @@
+# the memory held by the results of a size sweep is measured here (python memoryBenchmark.py)
+
+import time
+import tracemalloc
+
+import runner
+from input import Input
+
+
+def measureSweep(inp: Input):  # retained and peak memory [bytes] and time [s] of the sweep
+    tracemalloc.start()
+    startTime = time.perf_counter()
+    results = runner.computeSizes(inp)
+    duration = time.perf_counter() - startTime
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return retained, peak, duration
+
+
+if __name__ == '__main__':
+    inp = Input()
+    numberSizes = len(inp.population) if inp.population.__class__ is list else 1
+    for isResultCompact in [False, True]:
+        inp.isResultCompact = isResultCompact
+        retained, peak, duration = measureSweep(inp)
+        print("%s: %i sizes, %.1f MB retained (%.1f kB per size), %.1f MB peak, %.1f s"
+              % ("compact" if isResultCompact else "habitats", numberSizes, retained / 1e6, retained / 1e3 / numberSizes, peak / 1e6, duration))
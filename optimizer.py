@@ -1,17 +1,36 @@
 # the mass required for cooling can be approximately minimized here (optimizing the power to overcome friction)
 
 import helpers
+from cooling import CoolingEvaluator
 from habitat import Habitat
 from input import Input
 
 
-def getOptimizedResult(inp: Input, power, hullPowerPerSurface):
-    # computation with start values:
-    res = Habitat(inp, power, inp.absorptionFrictionFraction, inp.connectionFrictionFraction, inp.emissionFrictionFraction, hullPowerPerSurface)
+def getOptimizedResult(inp: Input, power, hullPowerPerSurface, startFrictions=None):
+    # computation with start values (by default from the input, or e.g. the optimized ones of the previous size):
+    if startFrictions is None or min(startFrictions) <= 0:
+        startFrictions = inp.absorptionFrictionFraction, inp.connectionFrictionFraction, inp.emissionFrictionFraction
+    evaluator = CoolingEvaluator(inp, power, *startFrictions, hullPowerPerSurface)  # only cooling, without structure
+    res = evaluator.startHabitat
     if res.coolingPower == 0:
-        return Habitat(power, 0, 0, 0)
+        res = Habitat(inp, power, 0, 0, 0, hullPowerPerSurface)
+        res.frictionIterations = 0
+        res.frictionEvaluations = evaluator.numberEvaluations
+        return res
 
-    # new friction fractions:
+    if inp.frictionOptimizer == helpers.OptimizerType.Iterated:
+        res = getIteratedResult(inp, evaluator)
+    else:  # SingleStep
+        res = evaluator.evaluate(*getOptimizedFrictions(inp, res))
+        res.frictionIterations = 1
+
+    # full computation with optimized friction:
+    res = evaluator.complete(res)
+    res.frictionEvaluations = evaluator.numberEvaluations
+    return res
+
+
+def getOptimizedFrictions(inp: Input, res: Habitat):  # analytic update of the friction fractions for a computed habitat
     linearMass = res.connection.outerConnectionCoolantMass + res.emission.emissionSurfaceMass \
                  + res.electricMassPerPower * (1 + res.absFriction) * (1 + res.conFriction) * (1 + res.emFriction) * res.coolingPower
 
@@ -33,5 +52,18 @@ def getOptimizedResult(inp: Input, power, hullPowerPerSurface):
         conFriction *= scaling
         emFriction *= scaling
 
-    # computation with optimized friction:
-    return Habitat(inp, power, absFriction, conFriction, emFriction)
+    return absFriction, conFriction, emFriction
+
+
+def getIteratedResult(inp: Input, evaluator: CoolingEvaluator):  # repeated updates until the cooling mass has converged
+    res = bestRes = evaluator.startHabitat
+    for numberIterations in range(1, inp.maxFrictionIterations + 1):
+        newRes = evaluator.evaluate(*getOptimizedFrictions(inp, res))
+        change = abs(newRes.totalCoolingMass - res.totalCoolingMass) / res.totalCoolingMass
+        res = newRes
+        if (res.isCoolingPossible, -res.totalCoolingMass) > (bestRes.isCoolingPossible, -bestRes.totalCoolingMass):
+            bestRes = res
+        if change <= inp.frictionRelativeTolerance:
+            break
+    bestRes.frictionIterations = numberIterations
+    return bestRes
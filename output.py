@@ -1,25 +1,48 @@
 ﻿# model results are plotted here
 
-import matplotlib.pyplot as plt
+import os
 
+import numpy as np
+
+import limits
+import runner
 from habitat import Habitat
 from input import Input
-from sketch import Sketch
+from results import SweepResults
+
+plt = None  # matplotlib.pyplot, imported only if figures are built
 
 
 class Output:
     showFigures = True  # if figures are shown
     saveFigures = False  # if figures are saved in the project directory
     printOnlyShortResults = False  # if a short version of the results is printed
+    isHeadless = False  # if no figures are built (without importing matplotlib), but the results are written as tables into the project directory
+    tableFormat = "csv"  # "csv" or "json" (only if isHeadless)
 
     def __init__(self, inp: Input, runResults: [[Habitat]]):
         self.inp = inp
         self.runResults = runResults
-        self.habitats = runResults[0]
-        self.firstHab = self.habitats[0]
-        self.xvals = [hab.habPower for hab in self.habitats]
-
-        self.printResultsForFirstPower()
+        self.isColumnar = isinstance(runResults[0], SweepResults)  # habitats not kept (batch, stored or compact results)
+        self.runColumns = [results if isinstance(results, SweepResults) else SweepResults.fromHabitats(iRun, results)
+                           for iRun, results in enumerate(runResults)]  # plotted quantities
+        self.firstHabitats = [results.firstHabitat if isinstance(results, SweepResults) else results[0]
+                              for results in runResults]  # complete habitat of the first size (None for batch or stored results)
+        self.habitats = self.runColumns[0]
+        self.xvals = self.habitats["habPower"]
+        self.isStructureComputed = "structure.totalStructuralMass" in self.habitats
+        if self.firstHabitats[0] is not None:
+            self.firstHab = self.firstHabitats[0]
+            self.printResultsForFirstPower()
+
+        if self.isHeadless:
+            self.writeTables()
+            if inp.population.__class__ is list:
+                self.print_Limits()
+            return
+
+        global plt
+        import matplotlib.pyplot as plt
 
         if inp.population.__class__ is not list:
 
@@ -33,23 +56,36 @@ class Output:
             self.plot_Area()
             self.plot_Length()
             self.plot_PowerFraction()
-            self.plot_StructuralMass()
-            self.plot_MassPerVolume()
+            if self.isStructureComputed:
+                self.plot_StructuralMass()
+                self.plot_MassPerVolume()
 
             if inp.numberRuns > 1:  # for different parameters
                 self.plot_CoolingMasses()
                 self.plot_Frictions()
                 self.plot_Volumes()
-                self.plot_HullAndStructuralMasses()
+                if self.isStructureComputed:
+                    self.plot_HullAndStructuralMasses()
 
             self.print_Limits()
 
         if self.showFigures:
             plt.show()
 
+    def writeTables(self):  # one table per run, with the scalar quantities of each size
+        os.makedirs(self.inp.project, exist_ok=True)
+        for iRun, results in enumerate(self.runColumns):
+            path = os.path.join(self.inp.project, "results_run%i.%s" % (iRun, self.tableFormat))
+            if self.tableFormat == "json":
+                results.writeJson(path)
+            else:
+                results.writeCsv(path)
+            print("Results written to " + path)
+
     def printResultsForFirstPower(self):
-        for res in self.runResults:
-            hab = res[0]
+        for hab in self.firstHabitats:
+            if hab is None:
+                continue
             print("\nFirst size (%.2e W, %.2e m³, %.2e people)" % (hab.habPower, hab.shape.habVolume, hab.population))
             if self.inp.numberRuns > 1:
                 print(" of model run #" + str(hab.iRun) + " " + self.inp.label[hab.iRun] + ":")
@@ -73,6 +109,8 @@ class Output:
             print("Absorption Friction %.2e W" % hab.absorption.absorptionFrictionPower)
             print("Connection Friction %.2e W" % hab.connection.connectionFrictionPower)
             print("Emission Friction %.2e W" % hab.emission.emissionFrictionPower)
+            if self.inp.isFrictionOptimized:
+                print("Friction Optimization: %i iterations, %i evaluations" % (hab.frictionIterations, hab.frictionEvaluations))
 
             print("\nTotal Mass %.2e kg" % hab.totalMass)
             print("Hull Mass %.2e kg" % hab.shape.hullMass)
@@ -143,17 +181,16 @@ class Output:
             print("Light channels %.2e of habitat volume" % (hab.lightCollection.lightVolume / hab.shape.habVolume))
             print("Cooling %.2e of habitat volume" % hab.connection.coolantVolumeFraction)
 
-    def showCurve(self, ax, y: str, lab: str, cont="", perPower=True, lstyle="-"):
-        yvals = []
-        for hab in self.habitats:
-            if ((cont == "cool") and hab.isCoolingPossible) or (cont == "light") or (cont == ""):
-                if "." in y:
-                    yvals.append(getattr(getattr(hab, y.split(".")[0]), y.split(".")[1]))
-                else:
-                    yvals.append(getattr(hab, y))
-                if perPower:
-                    yvals[-1] /= hab.habPower
-        ax.plot(self.xvals[:len(yvals)], yvals, label=lab, linestyle=lstyle)
+    def showCurve(self, ax, y: str, lab: str, cont="", perPower=True, lstyle="-", results: SweepResults = None):
+        if results is None:
+            results = self.habitats
+        if y not in results:  # e.g. not computed in batch mode
+            return
+        isShown = results["isCoolingPossible"] if cont == "cool" else np.full(len(results), True)
+        yvals = results[y][isShown]
+        if perPower:
+            yvals = yvals / results["habPower"][isShown]
+        ax.plot(results["habPower"][:len(yvals)], yvals, label=lab, linestyle=lstyle)
         if len(yvals) > 0:
             print(lab + ": %.2e" % yvals[0])
 
@@ -249,24 +286,25 @@ class Output:
         ax.set_ylabel("Fraction of Component Mass []")
         ax.loglog()
         print("\nFraction of Component Mass []")
-        ax.plot(self.xvals, [hab.structure.pressureStructuralMass / hab.structure.pressureReferenceMass for hab in self.habitats], label="Air & Coolant", linestyle="-")
-        print("\t Air" + ": %.2e" % (self.habitats[0].structure.pressureStructuralMass / self.habitats[0].structure.pressureReferenceMass))
-        ax.plot(self.xvals, [hab.structure.interiorFraction for hab in self.habitats], label="Interior", linestyle="-")
-        print("\t Interior" + ": %.2e" % self.habitats[0].structure.interiorFraction)
-        ax.plot(self.xvals, [hab.structure.hullFraction for hab in self.habitats], label="Hull", linestyle="-")
-        print("\t Hull" + ": %.2e" % self.habitats[0].structure.hullFraction)
-        ax.plot(self.xvals, [hab.structure.radiatorFraction for hab in self.habitats], label="Radiator", linestyle="-")
-        print("\t Radiator" + ": %.2e" % self.habitats[0].structure.radiatorFraction)
-        ax.plot(self.xvals, [hab.structure.lightFraction for hab in self.habitats], label="Light", linestyle="-")
-        print("\t Light" + ": %.2e" % self.habitats[0].structure.lightFraction)
-        ax.plot(self.xvals, [hab.structure.electricFraction for hab in self.habitats], label="Electric", linestyle="-")
-        print("\t Electric" + ": %.2e" % self.habitats[0].structure.electricFraction)
+        pressureFractions = self.habitats["structure.pressureStructuralMass"] / self.habitats["structure.pressureReferenceMass"]
+        ax.plot(self.xvals, pressureFractions, label="Air & Coolant", linestyle="-")
+        print("\t Air" + ": %.2e" % pressureFractions[0])
+        ax.plot(self.xvals, self.habitats["structure.interiorFraction"], label="Interior", linestyle="-")
+        print("\t Interior" + ": %.2e" % self.habitats["structure.interiorFraction"][0])
+        ax.plot(self.xvals, self.habitats["structure.hullFraction"], label="Hull", linestyle="-")
+        print("\t Hull" + ": %.2e" % self.habitats["structure.hullFraction"][0])
+        ax.plot(self.xvals, self.habitats["structure.radiatorFraction"], label="Radiator", linestyle="-")
+        print("\t Radiator" + ": %.2e" % self.habitats["structure.radiatorFraction"][0])
+        ax.plot(self.xvals, self.habitats["structure.lightFraction"], label="Light", linestyle="-")
+        print("\t Light" + ": %.2e" % self.habitats["structure.lightFraction"][0])
+        ax.plot(self.xvals, self.habitats["structure.electricFraction"], label="Electric", linestyle="-")
+        print("\t Electric" + ": %.2e" % self.habitats["structure.electricFraction"][0])
         ax.legend()
         if self.saveFigures:
             fig.savefig(self.inp.project + "\\structuralFractions.pdf")
 
     def plot_StructuralMass(self):
-        xvals = [hab.shape.habVolume for hab in self.habitats]
+        xvals = self.habitats["shape.habVolume"]
 
         fig, ax = plt.subplots()
         ax.set_title("Structural mass components")
@@ -276,26 +314,26 @@ class Output:
 
         self.AxisForPopulation(ax)
 
-        ax.plot(xvals, [hab.structure.pressureStructuralMass / hab.shape.habVolume for hab in self.habitats], label="Pressure Containment", linestyle="-", color="magenta")
-        ax.plot(xvals, [hab.structure.pressureReferenceMass / hab.shape.habVolume for hab in self.habitats], label="Air & Coolant", linestyle="--", color="magenta")
+        ax.plot(xvals, self.habitats["structure.pressureStructuralMass"] / xvals, label="Pressure Containment", linestyle="-", color="magenta")
+        ax.plot(xvals, self.habitats["structure.pressureReferenceMass"] / xvals, label="Air & Coolant", linestyle="--", color="magenta")
 
-        ax.plot(xvals, [hab.structure.interiorStructuralMass / hab.shape.habVolume for hab in self.habitats], label="Interior Support", linestyle="-", color="green")
-        ax.plot(xvals, [hab.structure.interiorReferenceMass / hab.shape.habVolume for hab in self.habitats], label="Interior & Absorption Cooling", linestyle="--", color="green")
+        ax.plot(xvals, self.habitats["structure.interiorStructuralMass"] / xvals, label="Interior Support", linestyle="-", color="green")
+        ax.plot(xvals, self.habitats["structure.interiorReferenceMass"] / xvals, label="Interior & Absorption Cooling", linestyle="--", color="green")
 
-        ax.plot(xvals, [hab.structure.hullStructuralMass / hab.shape.habVolume for hab in self.habitats], label="Hull Support", linestyle="-", color="red")
-        ax.plot(xvals, [hab.structure.hullReferenceMass / hab.shape.habVolume for hab in self.habitats], label="Hull", linestyle="--", color="red")
+        ax.plot(xvals, self.habitats["structure.hullStructuralMass"] / xvals, label="Hull Support", linestyle="-", color="red")
+        ax.plot(xvals, self.habitats["structure.hullReferenceMass"] / xvals, label="Hull", linestyle="--", color="red")
 
-        ax.plot(xvals, [hab.structure.radiatorStructuralMass / hab.shape.habVolume for hab in self.habitats], label="Radiator Support", linestyle="-", color="black")
-        ax.plot(xvals, [hab.structure.radiatorReferenceMass / hab.shape.habVolume for hab in self.habitats], label="Radiator", linestyle="--", color="black")
+        ax.plot(xvals, self.habitats["structure.radiatorStructuralMass"] / xvals, label="Radiator Support", linestyle="-", color="black")
+        ax.plot(xvals, self.habitats["structure.radiatorReferenceMass"] / xvals, label="Radiator", linestyle="--", color="black")
 
-        ax.plot(xvals, [hab.structure.lightStructuralMass / hab.shape.habVolume for hab in self.habitats], label="Mirror Support", linestyle="-", color="yellow")
-        ax.plot(xvals, [hab.structure.lightReferenceMass / hab.shape.habVolume for hab in self.habitats], label="Co-rotating Mirrors", linestyle="--", color="yellow")
+        ax.plot(xvals, self.habitats["structure.lightStructuralMass"] / xvals, label="Mirror Support", linestyle="-", color="yellow")
+        ax.plot(xvals, self.habitats["structure.lightReferenceMass"] / xvals, label="Co-rotating Mirrors", linestyle="--", color="yellow")
 
-        ax.plot(xvals, [hab.structure.electricStructuralMass / hab.shape.habVolume for hab in self.habitats], label="PV Support", linestyle="-", color="blue")
-        ax.plot(xvals, [hab.structure.electricReferenceMass / hab.shape.habVolume for hab in self.habitats], label="Co-rotating PV", linestyle="--", color="blue")
+        ax.plot(xvals, self.habitats["structure.electricStructuralMass"] / xvals, label="PV Support", linestyle="-", color="blue")
+        ax.plot(xvals, self.habitats["structure.electricReferenceMass"] / xvals, label="Co-rotating PV", linestyle="--", color="blue")
 
-#        ax.plot(xvals, [hab.structure.totalStructuralMass / hab.shape.habVolume for hab in self.habitats], label="Total Structural", linestyle="-", color="orange")
-#        ax.plot(xvals, [hab.structure.totalReferenceMass / hab.shape.habVolume for hab in self.habitats], label="Total Reference", linestyle="--", color="orange")
+#        ax.plot(xvals, self.habitats["structure.totalStructuralMass"] / xvals, label="Total Structural", linestyle="-", color="orange")
+#        ax.plot(xvals, self.habitats["structure.totalReferenceMass"] / xvals, label="Total Reference", linestyle="--", color="orange")
 
         plt.subplots_adjust(right=0.6)
         ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
@@ -312,7 +350,7 @@ class Output:
 
 
     def plot_MassPerVolume(self):
-        xvals = [hab.shape.habVolume for hab in self.habitats]
+        xvals = self.habitats["shape.habVolume"]
 
         fig, ax = plt.subplots()
         ax.set_title("Main mass components")
@@ -321,11 +359,11 @@ class Output:
         ax.loglog()
         self.AxisForPopulation(ax)
 
-        ax.plot(xvals, [hab.shape.interiorMass / hab.shape.habVolume for hab in self.habitats], label="Interior", linestyle="-", color="green")
-        ax.plot(xvals, [hab.shape.hullMass / hab.shape.habVolume for hab in self.habitats], label="Hull", linestyle="-", color="red")
-        ax.plot(xvals, [hab.totalCoolingMass / hab.shape.habVolume for hab in self.habitats], label="Cooling", linestyle="-", color="blue")
-        ax.plot(xvals, [hab.structure.totalStructuralMass / hab.shape.habVolume for hab in self.habitats], label="Structural", linestyle="-", color="orange")
-        ax.plot(xvals, [hab.totalMass / hab.shape.habVolume for hab in self.habitats], label="Total Habitat", linestyle=":", color="black")
+        ax.plot(xvals, self.habitats["shape.interiorMass"] / xvals, label="Interior", linestyle="-", color="green")
+        ax.plot(xvals, self.habitats["shape.hullMass"] / xvals, label="Hull", linestyle="-", color="red")
+        ax.plot(xvals, self.habitats["totalCoolingMass"] / xvals, label="Cooling", linestyle="-", color="blue")
+        ax.plot(xvals, self.habitats["structure.totalStructuralMass"] / xvals, label="Structural", linestyle="-", color="orange")
+        ax.plot(xvals, self.habitats["totalMass"] / xvals, label="Total Habitat", linestyle=":", color="black")
         plt.subplots_adjust(right=0.75)
         ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
         if self.saveFigures:
@@ -348,7 +386,7 @@ class Output:
         ax.loglog()
         print("\nCooling Mass per Power [kg/W]")
         for iRun in range(self.inp.numberRuns):
-            self.showCurve(ax, "totalCoolingMass", "Cooling Mass " + self.inp.label[iRun], "cool", True, self.getLinestyle(iRun))
+            self.showCurve(ax, "totalCoolingMass", "Cooling Mass " + self.inp.label[iRun], "cool", True, self.getLinestyle(iRun), self.runColumns[iRun])
         ax.legend()
         if self.saveFigures:
             fig.savefig(self.inp.project + "\\totalCoolingMass.pdf")
@@ -361,10 +399,9 @@ class Output:
         ax.loglog()
         print("\nFriction to Cooling Power")
         for iRun in range(self.inp.numberRuns):
-            habitats = self.runResults[iRun]
-            self.showCurve(ax, "absFriction", "Absorption " + self.inp.label[iRun], "cool", False, self.getLinestyle(iRun))
-            self.showCurve(ax, "conFriction", "Connection " + self.inp.label[iRun], "cool", False, self.getLinestyle(iRun))
-            self.showCurve(ax, "emFriction", "Emission " + self.inp.label[iRun], "cool", False, self.getLinestyle(iRun))
+            self.showCurve(ax, "absFriction", "Absorption " + self.inp.label[iRun], "cool", False, self.getLinestyle(iRun), self.runColumns[iRun])
+            self.showCurve(ax, "conFriction", "Connection " + self.inp.label[iRun], "cool", False, self.getLinestyle(iRun), self.runColumns[iRun])
+            self.showCurve(ax, "emFriction", "Emission " + self.inp.label[iRun], "cool", False, self.getLinestyle(iRun), self.runColumns[iRun])
         ax.legend()
         if self.saveFigures:
             fig.savefig(self.inp.project + "\\optimizedFriction.pdf")
@@ -376,15 +413,13 @@ class Output:
         ax.set_ylabel("Volume per Power [m³/W]")
         ax.loglog()
         print("\nVolume per Power [m³/W]")
-        habitats = self.runResults[0]
         self.showCurve(ax, "shape.habVolume", "Habitat")
         self.showCurve(ax, "shape.hullVolume", "Hull")
         self.showCurve(ax, "lightCollection.lightVolume", "Light Channels", "light")
         for iRun in range(self.inp.numberRuns):
-            habitats = self.runResults[iRun]
-            self.showCurve(ax, "absorption.absorptionVolume", "Absorption " + self.inp.label[iRun], "cool", True, self.getLinestyle(iRun))
-            self.showCurve(ax, "connection.connectionVolume", "Connection " + self.inp.label[iRun], "cool", True, self.getLinestyle(iRun))
-            self.showCurve(ax, "emission.emissionVolume", "Emission " + self.inp.label[iRun], "cool", True, self.getLinestyle(iRun))
+            self.showCurve(ax, "absorption.absorptionVolume", "Absorption " + self.inp.label[iRun], "cool", True, self.getLinestyle(iRun), self.runColumns[iRun])
+            self.showCurve(ax, "connection.connectionVolume", "Connection " + self.inp.label[iRun], "cool", True, self.getLinestyle(iRun), self.runColumns[iRun])
+            self.showCurve(ax, "emission.emissionVolume", "Emission " + self.inp.label[iRun], "cool", True, self.getLinestyle(iRun), self.runColumns[iRun])
         ax.legend()
         if self.saveFigures:
             fig.savefig(self.inp.project + "\\volumes.pdf")
@@ -393,64 +428,14 @@ class Output:
         for iRun in range(self.inp.numberRuns):
             if self.inp.numberRuns > 1:
                 print("\n" + self.inp.label[iRun]+":")
-            habitats = self.runResults[iRun]
-            for res in habitats:
-                if res.shape.hullMass < res.shape.interiorMass:
-                    print("Hull mass is larger than interior mass (%.1e kg) below pop. %.1e / %.1e m³ / %.1e W" % (res.shape.interiorMass, res.population, res.shape.habVolume, res.habPower))
-                    break
-            for res in habitats:
-                if res.structure.rotationRate_rpm < 3:
-                    print("Rotational rate is larger than 3rpm below pop. %.1e / %.1e m³ / %.1e W" % (res.population, res.shape.habVolume, res.habPower))
-                    break
-
-            for res in habitats:
-                if res.insidePower > res.hullPower:
-                    print("No natural cooling above pop. %.1e / %.1e m³ / %.1e W" % (res.population, res.shape.habVolume, res.habPower))
-                    break
-
-            for res in habitats:
-                if not res.isCoolingPossible:
-                    print("No complete cooling above pop. %.1e / %.1e m³ / %.1e W - %s" % (res.population, res.shape.habVolume, res.habPower, res.coolingReport))
-                    break
-            for res in habitats:
-                if res.structure.coRotationalElectricFraction < 1:
-                    print("No complete co-rotation of PV above pop. %.1e / %.1e m³ / %.1e W" % (res.population, res.shape.habVolume, res.habPower))
-                    break
-            for res in habitats:
-                if res.structure.coRotationalLightFraction < 1:
-                    print("No complete co-rotation of mirrors above pop. %.1e / %.1e m³ / %.1e W" % (res.population, res.shape.habVolume, res.habPower))
-                    break
-
-            for res in habitats:
-                if not res.isCompleteLighting:
-                    print("No complete lighting above pop. %.1e / %.1e m³ / %.1e W - %s" % (res.population, res.shape.habVolume, res.habPower, res.lightingReport))
-                    break
-            for res in habitats:
-                if res.shape.rotationalRadius > res.structure.coRotationalRadius:
-                    print("Rotational radius surpasses critical co-rotational radius at pop. %.1e / %.1e m  %.1e m³ / %.1e W" % (res.population, res.shape.rotationalRadius, res.shape.habVolume, res.habPower))
-                    break
-            for res in habitats:
-                if res.totalCoolingMass > res.shape.interiorMass:
-                    print("Cooling mass surpasses the interior mass at pop. %.1e / %.1e m³ / %.1e W" % (res.population, res.shape.habVolume, res.habPower))
-                    break
-
-            for res in habitats:
-                if res.structure.totalStructuralMass > res.shape.hullMass:
-                    print("Structural mass surpasses hull mass at pop. %.1e / %.1e m³ / %.1e W" % (res.population, res.shape.habVolume, res.habPower))
-                    break
-            for res in habitats:
-                if res.structure.totalStructuralMass > res.shape.interiorMass:
-                    print("Structural mass surpasses the interior mass at pop. %.1e / %.1e m³ / %.1e W" % (res.population, res.shape.habVolume, res.habPower))
-                    break
-            oldInteriorMassFraction = 0
-            for res in habitats:
-                interiorMassFraction = res.shape.interiorMass / res.totalMass
-                if interiorMassFraction < oldInteriorMassFraction:
-                    print(s)
-                    break
-                else:
-                    oldInteriorMassFraction = interiorMassFraction
-                    s = "Maximum interior mass fraction (%.3f) / minimum mass per volume at pop. %.1e / %.1e m³ / %.1e W" % (interiorMassFraction, res.population, res.shape.habVolume, res.habPower)
+            habitats = None if self.isColumnar else self.runResults[iRun]
+            computeHabitat = None
+            if self.inp.isLimitRefined:  # additional habitats between the sizes, with the input of the run
+                runInp = self.inp if self.inp.numberRuns == 1 else self.inp.runInputs[iRun]
+                hullPowerPerSurface = runner.getHullPowerPerSurface(runInp, runInp.population)
+                computeHabitat = lambda pop: runner.computeHabitat(runInp, pop, hullPowerPerSurface)
+            for message in limits.findLimits(self.runColumns[iRun], habitats, computeHabitat, self.inp.limitRelativeTolerance):
+                print(message)
 
     def plot_HullAndStructuralMasses(self):
         fig, ax = plt.subplots()
@@ -458,21 +443,22 @@ class Output:
         ax.set_xlabel("Interior Volume [m³]")
         ax.set_ylabel("Mass per Volume [kg/m³]")
         ax.loglog()
-        xvals = [hab.shape.habVolume for hab in self.runResults[0]]
         for iRun in range(self.inp.numberRuns):
-            results = self.runResults[iRun]
-            ax.plot(xvals, [hab.shape.hullMass / hab.shape.habVolume for hab in results], label="Hull " + self.inp.label[iRun], linestyle="-")
-            ax.plot(xvals, [hab.structure.totalStructuralMass / hab.shape.habVolume for hab in results], label="Structure " + self.inp.label[iRun], linestyle=":")
+            results = self.runColumns[iRun]
+            xvals = results["shape.habVolume"]
+            ax.plot(xvals, results["shape.hullMass"] / xvals, label="Hull " + self.inp.label[iRun], linestyle="-")
+            ax.plot(xvals, results["structure.totalStructuralMass"] / xvals, label="Structure " + self.inp.label[iRun], linestyle=":")
     
         ax.legend()
         if self.saveFigures:
             fig.savefig(self.inp.project + "\\HullAndStructuralMasses.pdf")
 
     def showSketchForFirstPower(self, onlyFirstRun: bool):
+        from sketch import Sketch  # (imports matplotlib)
         for iRun in range(self.inp.numberRuns):
             if onlyFirstRun and iRun > 0:
                 break
-            hab = self.runResults[iRun][0]
+            hab = self.firstHabitats[iRun]
             sketch = Sketch(shape=hab.shape, corot_limit=hab.structure.coRotationalRadius,
                    light_radius=hab.lightRadius, collection_radius=hab.collectionRadius, emission_radius=hab.emission.emissionRadius,
                    emission_length=hab.connection.emissionLength)
@@ -498,7 +484,7 @@ class Output:
             if not onlyFirstRun and self.inp.numberRuns > 1:
                 labeladdition = self.inp.label[iRun]
 
-            hab = self.runResults[iRun][0]
+            hab = self.firstHabitats[iRun]
             nbFloors = len(hab.gravity.groundRadii)
             xvals = [hab.gravity.groundRadii[i] * self.inp.maxGravity / hab.shape.rotationalRadius for i in range(nbFloors)]
 
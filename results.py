@@ -0,0 +1,101 @@
+# columnar model results of a size sweep are collected here
+
+import csv
+import json
+
+import numpy as np
+
+
+class SweepResults:
+    components = ("shape", "lightCollection", "absorption", "connection", "emission", "structure")  # one level deep
+
+    def __init__(self, iRun: int, columns: {str: np.ndarray}, firstHabitat=None):
+        self.iRun = iRun
+        self.columns = columns  # {name: values}, names as attribute paths of Habitat, e.g. "shape.hullMass"
+        self.firstHabitat = firstHabitat  # complete Habitat of the first size (if kept)
+
+    def __len__(self):
+        return len(self.columns["habPower"])
+
+    def __contains__(self, name: str):
+        return name in self.columns
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    @classmethod
+    def fromHabitats(cls, iRun: int, habitats):  # the scalar quantities of the habitats (no distributions)
+        names = cls.getNames(habitats[0])
+        return cls.fromRows(iRun, names, [cls.getRow(hab, names) for hab in habitats])
+
+    @classmethod
+    def fromRows(cls, iRun: int, names: [str], rows: [list], firstHabitat=None):  # rows of getRow
+        return SweepResults(iRun, {name: np.array(values) for name, values in zip(names, zip(*rows))}, firstHabitat)
+
+    @classmethod
+    def getNames(cls, hab):  # of the scalar quantities of a habitat
+        names = []
+        for name, value in cls.getAttributes(hab).items():
+            if name in cls.components:
+                names += [name + "." + subName for subName, subValue in cls.getAttributes(value).items() if cls.isScalar(subValue)]
+            elif cls.isScalar(value) and name != "iRun":
+                names.append(name)
+        return names
+
+    @staticmethod
+    def getAttributes(component):  # {name: value} of the set slots
+        return {name: getattr(component, name) for name in component.__slots__ if hasattr(component, name)}
+
+    @classmethod
+    def getRow(cls, hab, names: [str]):
+        return [cls.getValue(hab, name) for name in names]
+
+    @staticmethod
+    def isScalar(value):
+        return isinstance(value, (bool, int, float, np.bool_, np.number))
+
+    @staticmethod
+    def getValue(hab, name: str):
+        value = hab
+        for attribute in name.split("."):
+            value = getattr(value, attribute, np.nan)
+        return value
+
+    def save(self, path: str):
+        np.savez(path, iRun=self.iRun, **self.columns)
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path) as data:
+            return SweepResults(int(data["iRun"]), {name: data[name] for name in data.files if name != "iRun"})
+
+    def writeCsv(self, path: str):  # one row per habitat
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(self.columns.keys())
+            writer.writerows(zip(*(values.tolist() for values in self.columns.values())))
+
+    def writeJson(self, path: str):  # columns as lists (NaN as null)
+        columns = {name: [None if value != value else value for value in values.tolist()] for name, values in self.columns.items()}
+        with open(path, "w") as file:
+            json.dump({"iRun": self.iRun, "columns": columns}, file)
+
+
+class SweepWriter:  # the scalar quantities of habitats appended to a csv file as they are computed (header from the first one)
+    def __init__(self, path: str):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.names = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.file.close()
+
+    def append(self, hab):
+        if self.names is None:
+            self.names = SweepResults.getNames(hab)
+            self.writer.writerow(self.names)
+        self.writer.writerow(SweepResults.getRow(hab, self.names))
+        self.file.flush()  # visible while the sweep is running
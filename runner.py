@@ -0,0 +1,129 @@
+# the sizes of a model run are computed here, and multiple runs are distributed over parallel processes
+
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import helpers
+import optimizer
+from batch import HabitatBatch
+from habitat import Habitat
+from hullTransfer import HullTransfer
+from input import Input
+from limits import HabitatValues, LimitDetector
+from results import SweepResults, SweepWriter
+from sampler import AdaptiveSampler
+from shape import Shape
+from snapshot import InputSnapshot
+from store import ResultStore
+
+
+def computeSizes(inp: Input):
+    if inp.isResultStored and inp.population.__class__ is list:
+        store = ResultStore(inp.project)
+        results = store.load(inp)
+        if results is not None:
+            print("Loaded stored results of model run #%i" % inp.iRun)
+            return results
+        results = computeSweep(inp)
+        store.save(inp, results)
+        return results
+    return computeSweep(inp)
+
+
+def computeSweep(inp: Input):
+    if inp.isBatchComputed and inp.population.__class__ is list:
+        return HabitatBatch(inp, [pop * inp.powerPerPerson for pop in inp.population], inp.absorptionFrictionFraction,
+                            inp.connectionFrictionFraction, inp.emissionFrictionFraction, getHullPowerPerSurface(inp, inp.population)).results
+    if inp.isPopulationAdaptive and inp.population.__class__ is list:
+        hullPowerPerSurface = getHullPowerPerSurface(inp, inp.population)
+        habitats = AdaptiveSampler(inp, lambda pop: computeHabitat(inp, pop, hullPowerPerSurface)).run()
+    else:
+        habitats = generateSizes(inp)
+    if not (inp.isResultCompact and inp.population.__class__ is list):
+        return list(habitats)
+    rows = []  # of the scalar quantities; the habitats (with their distributions) are dropped, except the first one
+    for hab in habitats:
+        if len(rows) == 0:
+            firstHab, names = hab, SweepResults.getNames(hab)
+        rows.append(SweepResults.getRow(hab, names))
+    return SweepResults.fromRows(inp.iRun, names, rows, firstHab)
+
+
+def getHullPowerPerSurface(inp: Input, pops):
+    tempShape = Shape(inp, pops[0] * inp.powerPerPerson)
+    return HullTransfer.getPowerPerSurface(inp, tempShape.crossSection / tempShape.hullSurface)
+
+
+def generateSizes(inp: Input):  # the habitats of a sweep, computed one at a time
+    pops = inp.population
+    if inp.population.__class__ is not list:
+        pops = [inp.population]
+        print("population %.1e, power %.2e W, volume %.2e m³" % (inp.population, inp.population * inp.powerPerPerson, inp.population * inp.volumePerPerson))
+
+    hullPowerPerSurface = getHullPowerPerSurface(inp, pops)
+    lastHab = None
+    for pop in pops:
+        hab = computeHabitat(inp, pop, hullPowerPerSurface, lastHab)
+        yield hab
+        lastHab = hab
+
+
+def computeHabitat(inp: Input, pop, hullPowerPerSurface, lastHab: Habitat = None):  # lastHab: of the previous size, if any
+    power = pop * inp.powerPerPerson
+    if inp.isFrictionOptimized:
+        startFrictions = None
+        if inp.isFrictionWarmStarted and lastHab is not None and lastHab.isCoolingPossible:  # the optimum changes smoothly with the size
+            startFrictions = lastHab.absFriction, lastHab.conFriction, lastHab.emFriction
+        return optimizer.getOptimizedResult(inp, power, hullPowerPerSurface, startFrictions)
+    return Habitat(inp, power, inp.absorptionFrictionFraction, inp.connectionFrictionFraction,
+                   inp.emissionFrictionFraction, hullPowerPerSurface)
+
+
+def streamSizes(inp: Input):  # the sizes are appended to a table in the project directory as they are computed, only the limits are kept
+    path = os.path.join(inp.project, "sweep_run%i.csv" % inp.iRun)
+    os.makedirs(inp.project, exist_ok=True)
+    detector = LimitDetector()
+    with SweepWriter(path) as writer:
+        for hab in generateSizes(inp):
+            writer.append(hab)
+            detector.update(HabitatValues(hab))
+    print("Results of model run #%i written to %s" % (inp.iRun, path))
+    return detector
+
+
+def getRunInput(inp: Input, iRun: int):
+    runInp = copy.copy(inp)
+    runInp.label = []  # own list instead of the class-level one
+    vars(runInp).pop("runInputs", None)  # of a previous computation of the runs
+    for i in range(iRun + 1):  # the changes of previous runs are kept, as in a serial computation
+        runInp.changeParameters(i)
+    return runInp
+
+
+def describeChanges(previous: InputSnapshot, current: InputSnapshot):  # changed parameters and cached subsystems
+    changedFields = current.changedFields(previous)
+    if len(changedFields) == 0:
+        return "nothing"
+    changedSubsystems = current.changedSubsystems(previous, [Shape, HullTransfer, helpers.CoolingHelper])
+    return ", ".join(changedFields) + " (recomputed: " + ", ".join(subsystem.__name__ for subsystem in changedSubsystems) + ")"
+
+
+def computeRuns(inp: Input, computeRun=computeSizes):  # computeRun e.g. streamSizes
+    if inp.numberRuns == 1:
+        print("Computing model " + inp.project + "...")
+        return [computeRun(inp)]
+
+    runInputs = [getRunInput(inp, iRun) for iRun in range(inp.numberRuns)]
+    inp.runInputs = runInputs  # before the changes below, e.g. for additional habitats of a run in the output
+    snapshots = [InputSnapshot(runInp) for runInp in runInputs]
+    for iRun in range(inp.numberRuns):  # final parameters and labels of the input as after a serial computation
+        inp.changeParameters(iRun)
+        print("Computing model number %i (%s)..." % (iRun, inp.label[iRun]))
+        if iRun > 0:
+            print("  changed: " + describeChanges(snapshots[iRun - 1], snapshots[iRun]))
+
+    if inp.numberProcesses == 1:
+        return [computeRun(runInp) for runInp in runInputs]
+    with ProcessPoolExecutor(max_workers=inp.numberProcesses) as executor:
+        return list(executor.map(computeRun, runInputs))  # in run order
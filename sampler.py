@@ -0,0 +1,59 @@
+# the sizes of a sweep are chosen adaptively here: starting from a coarse sweep, sizes are inserted where the results bend
+# or a regime changes (a limit is reached, or the connection exponent switches), up to a number of habitats
+
+import math
+
+import numpy as np
+
+import limits
+from helpers import LogRange
+from input import Input
+
+
+class AdaptiveSampler:
+    quantities = ("totalMass", "totalCoolingMass", "structure.totalStructuralMass", "shape.hullMass", "electricMass",
+                  "lightCollection.lightMass", "lightCollection.lightCollectionArea", "emission.emissionSurface")  # per power, in log-log
+    regimeWeight = 0.3  # score of an interval with a regime change, per decade (as a bend of one decade per decade)
+    minRelativeStep = 1e-3  # of the population between neighbouring sizes
+
+    def __init__(self, inp: Input, computeHabitat):  # computeHabitat(population)
+        self.inp = inp
+        self.computeHabitat = computeHabitat
+        self.habitats = []  # sorted by population
+        self.logValues = []  # [log10 of the quantities per power] of each habitat (nan if not positive)
+        self.regimes = []
+
+    def add(self, index, pop):
+        hab = self.computeHabitat(pop)
+        values = np.array([limits.HabitatValues(hab)[name] for name in self.quantities], dtype=float) / hab.habPower
+        with np.errstate(divide="ignore", invalid="ignore"):
+            logValues = np.where(values > 0, np.log10(values), np.nan)
+        regime = tuple(bool(isReached(limits.HabitatValues(hab))) for name, isReached, getMessage in limits.limits) \
+            + (hab.connection.connectionExponent,)
+        self.habitats.insert(index, hab)
+        self.logValues.insert(index, logValues)
+        self.regimes.insert(index, regime)
+
+    def getScores(self):  # of the intervals between neighbouring sizes: width times the bend of the curves at their ends
+        logPops = np.log10([hab.population for hab in self.habitats])
+        widths = np.diff(logPops)
+        slopes = np.diff(np.array(self.logValues), axis=0) / widths[:, None]
+        bends = np.nan_to_num(np.abs(np.diff(slopes, axis=0)))  # at the inner sizes (nan: not positive, no curve)
+        bends = np.concatenate([np.zeros((1, len(self.quantities))), bends, np.zeros((1, len(self.quantities)))])
+        scores = widths * np.max(np.maximum(bends[:-1], bends[1:]), axis=1)
+        isChanged = np.array([self.regimes[i] != self.regimes[i + 1] for i in range(len(widths))])
+        scores[isChanged] = np.maximum(scores[isChanged], self.regimeWeight * widths[isChanged])
+        scores[widths < math.log10(1 + self.minRelativeStep)] = 0
+        return scores
+
+    def run(self):  # habitats of the sweep, sorted by population
+        numberInitialSizes = max(2, min(self.inp.adaptiveInitialSizes, self.inp.adaptiveEvaluations))  # both ends, within the budget
+        for pop in LogRange(numberInitialSizes, min(self.inp.population), max(self.inp.population)):
+            self.add(len(self.habitats), pop)
+        while len(self.habitats) < self.inp.adaptiveEvaluations:
+            scores = self.getScores()
+            index = int(np.argmax(scores))
+            if scores[index] == 0:
+                break
+            self.add(index + 1, (self.habitats[index].population * self.habitats[index + 1].population) ** .5)
+        return self.habitats
@@ -1,9 +1,23 @@
 from helpers import ShapeType
 from input import Input
+from snapshot import fieldValues
+from collections import OrderedDict
 import math
+import numpy as np
 
 
 class Shape:
+    __slots__ = ("habVolume", "shapeType", "oppositeRotationalRadius", "rotationalRadius", "hullSurface", "crossSection", "massRatio",
+                 "tubeLengthToRotRadius", "cylinderLength", "tubeRadius", "oblateRadius", "torusHabRadius", "dumbbellMinorRadius",
+                 "dumbbellMajorRadius", "hullMass", "hullVolume", "airMass", "interiorMass")
+
+    # input parameters that determine the shape (besides the habitat volume)
+    inputFields = ("shapeType", "cylinderLengthToRotRadius", "tubeRadiusToRotRadius", "oblateMinorToRotRadius",
+                   "torusHabToRotRadius", "dumbbellMinorToRotRadius", "dumbbellMajorToMinorRadius", "hullSurfaceDensity",
+                   "hullDensity", "gapThickness", "airPressure", "interiorMassPerPerson", "volumePerPerson")
+    cache = OrderedDict()  # {(input parameters, habVolume): shape}, least recently used first
+    cacheSize = 1000  # maximum number of cached shapes
+
     def __init__(self, inp: Input, habVolume):
         self.habVolume = habVolume
         self.shapeType = inp.shapeType
@@ -59,7 +73,7 @@ class Shape:
                     + 2 * inp.tubeRadiusToRotRadius * self.tubeLengthToRotRadius)
         else:
             raise ValueError()
-        if (inp.shapeType in [ShapeType.Dumbbell, ShapeType.DumbbellTube]) and self.oppositeRotationalRadius > self.rotationalRadius:
+        if (inp.shapeType in [ShapeType.Dumbbell, ShapeType.DumbbellTube]) and np.any(self.oppositeRotationalRadius > self.rotationalRadius):
             raise Exception("Dumbbell too asymmetric")
         self.cylinderLength = self.rotationalRadius * inp.cylinderLengthToRotRadius
         self.tubeRadius = self.rotationalRadius * inp.tubeRadiusToRotRadius
@@ -71,4 +85,16 @@ class Shape:
         self.hullMass = self.hullSurface * inp.hullSurfaceDensity
         self.hullVolume = self.hullSurface * (inp.hullSurfaceDensity / inp.hullDensity + inp.gapThickness)
         self.airMass = self.habVolume * inp.airPressure * 1.2
-        self.interiorMass = max(self.airMass, self.habVolume / inp.volumePerPerson * inp.interiorMassPerPerson)
+        self.interiorMass = np.maximum(self.airMass, self.habVolume / inp.volumePerPerson * inp.interiorMassPerPerson)
+
+    @classmethod
+    def getForVolume(cls, inp: Input, habVolume):  # shared (not to be modified) shape with memoization
+        key = (fieldValues(inp, cls.inputFields), habVolume)
+        if key in cls.cache:
+            cls.cache.move_to_end(key)
+            return cls.cache[key]
+        shape = Shape(inp, habVolume)
+        cls.cache[key] = shape
+        if len(cls.cache) > cls.cacheSize:
+            cls.cache.popitem(last=False)
+        return shape
@@ -0,0 +1,57 @@
+# immutable snapshots of the input parameters are made here, e.g. to key caches or to find the parameters changed between runs
+
+import hashlib
+import types
+
+
+def freeze(value):  # hashable version of an input value
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def fieldValues(inp, fieldNames):  # key of an Input or InputSnapshot for the given parameters
+    return tuple(freeze(getattr(inp, name)) for name in fieldNames)
+
+
+class InputSnapshot:
+    ignoredFields = ("iRun", "label", "coolingHelper", "runInputs")  # run bookkeeping and attached caches
+
+    def __init__(self, inp):  # inp: Input (not imported, since helpers uses this module)
+        names = [name for name in sorted(dir(inp)) if not name.startswith("__") and name not in self.ignoredFields
+                 and not callable(getattr(inp, name))]
+        object.__setattr__(self, "inputClass", inp.__class__)
+        object.__setattr__(self, "fields", types.MappingProxyType({name: freeze(getattr(inp, name)) for name in names}))
+        object.__setattr__(self, "items", tuple(self.fields.items()))
+
+    def __getattr__(self, name):  # parameters, and the methods of the input evaluated with these parameters
+        if name in self.fields:
+            return self.fields[name]
+        attribute = getattr(self.inputClass, name)
+        if callable(attribute):
+            return types.MethodType(attribute, self)
+        return attribute
+
+    def __setattr__(self, name, value):
+        raise AttributeError("InputSnapshot is immutable")
+
+    def __eq__(self, other):
+        return isinstance(other, InputSnapshot) and self.items == other.items
+
+    def __hash__(self):
+        return hash(self.items)
+
+    @property
+    def digest(self):  # stable over processes and sessions (unlike hash)
+        return hashlib.sha256(repr(self.items).encode()).hexdigest()
+
+    def key(self, fieldNames):
+        return tuple(self.fields[name] for name in fieldNames)
+
+    def changedFields(self, other: "InputSnapshot"):
+        names = sorted(set(self.fields) | set(other.fields))
+        return [name for name in names if self.fields.get(name) != other.fields.get(name)]
+
+    def changedSubsystems(self, other: "InputSnapshot", subsystems):  # subsystems (classes) with changed inputFields
+        changed = set(self.changedFields(other))
+        return [subsystem for subsystem in subsystems if changed.intersection(subsystem.inputFields)]
@@ -0,0 +1,29 @@
+# computed size sweeps are stored here in the project directory, and reloaded if the input has not changed
+
+import os
+
+from input import Input
+from results import SweepResults
+from snapshot import InputSnapshot
+
+
+class ResultStore:
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def getPath(self, inp: Input):  # the snapshot includes the population, the sweep sizes
+        return os.path.join(self.directory, "results_" + InputSnapshot(inp).digest[:16] + ".npz")
+
+    def load(self, inp: Input):  # None if not stored
+        path = self.getPath(inp)
+        if not os.path.exists(path):
+            return None
+        results = SweepResults.load(path)
+        results.iRun = inp.iRun  # the run number is not part of the snapshot
+        return results
+
+    def save(self, inp: Input, results):
+        if not isinstance(results, SweepResults):
+            results = SweepResults.fromHabitats(inp.iRun, results)
+        os.makedirs(self.directory, exist_ok=True)
+        results.save(self.getPath(inp))
@@ -1,13 +1,28 @@
 import math
 
+import numpy as np
+
+import helpers
 from helpers import ShapeType
 from input import Input
 
 
 class Structure:
+    __slots__ = ("inp", "rotationalRadius", "rotationRate", "rotationRate_rpm", "coRotationalRadius", "pressureReferenceMass", "pressureStructuralMass",
+                 "interiorReferenceMass", "interiorStructuralMass", "interiorFraction", "hullReferenceMass", "hullStructuralMass", "hullFraction",
+                 "supportError", "supportEvaluations", "radiatorReferenceMass", "radiatorStructuralMass", "radiatorFraction", "lightReferenceMass",
+                 "lightStructuralMass", "coRotationalLightFraction", "lightFraction", "electricReferenceMass", "electricStructuralMass",
+                 "coRotationalElectricFraction", "electricFraction", "totalReferenceMass", "totalStructuralMass", "totalFraction")
+
+    # table of the vertical mass fraction f(r) as g(r) = f(r) / r² / exp(r²/2), smooth and between (pi/2)^.5 / 30 and 1,
+    # with its derivative, for cubic Hermite interpolation; built once per process
+    tableStep = 0.01
+    table = None  # radii, g, g'
+    tableError = None  # largest relative error of the interpolation (at the midpoints of the table intervals)
+
     def __init__(self, inp: Input, N: int = 10,  # number of shells for computation of energy system support
                  rotationalRadius: float = 0, pressuredVolume: float = 0, pressuredMass: float = 0,  # [m], [m³], [kg]
-                 groundDistribution: {float: float} = {},  # {radius: mass} [m]: [kg]
+                 groundDistribution: {float: float} = {},  # {radius: mass} [m]: [kg], or (radii, masses) arrays
                  hullDistribution: {float: float} = {},
                  radiatorMass=0, radiatorRadius=0,
                  lightMass=0, lightRadius=0,
@@ -22,19 +37,25 @@ class Structure:
 
         closedCircle = self.inp.shapeType in [ShapeType.Cylinder, ShapeType.Oblate, ShapeType.Torus]
 
-        self.interiorReferenceMass = sum(groundDistribution.values())
-        self.interiorStructuralMass = self.ComputeStructuralMass(groundDistribution, isHorizontalPossible=closedCircle)
-        if len(groundDistribution) > 0:
+        groundRadii, groundMasses = self.GetArrays(groundDistribution)
+        self.interiorReferenceMass = np.sum(groundMasses)
+        self.interiorStructuralMass = self.ComputeStructuralMass((groundRadii, groundMasses), isHorizontalPossible=closedCircle)
+        if len(groundRadii) > 0:
             self.interiorFraction = self.interiorStructuralMass / self.interiorReferenceMass
 
-        self.hullReferenceMass = sum(hullDistribution.values())
-        self.hullStructuralMass = self.ComputeStructuralMass(hullDistribution, isHorizontalPossible=closedCircle)
-        if len(hullDistribution) > 0:
+        hullRadii, hullMasses = self.GetArrays(hullDistribution)
+        self.hullReferenceMass = np.sum(hullMasses)
+        self.hullStructuralMass = self.ComputeStructuralMass((hullRadii, hullMasses), isHorizontalPossible=closedCircle)
+        if len(hullRadii) > 0:
             self.hullFraction = self.hullStructuralMass / self.hullReferenceMass
 
+        # energy system support: on N shells, or by adaptive quadrature with estimated error
+        self.supportError = 0 if inp.isSupportAdaptive else math.nan  # [kg] of the radiator, light and electric support
+        self.supportEvaluations = 0  # number of evaluated radii
+
         self.radiatorReferenceMass = radiatorMass
-        radiatorDistribution = {self.LinearEffectiveRadius(i, N, radiatorRadius): self.radiatorReferenceMass / N for i in range(N)}
-        self.radiatorStructuralMass = self.ComputeStructuralMass(radiatorDistribution, isHorizontalPossible=False, withBridges=False)
+        self.radiatorStructuralMass = self.ComputeSupportMass(self.radiatorReferenceMass, self.LinearEffectiveRadius(np.arange(N), N, radiatorRadius),
+                                                              0, radiatorRadius, isCircular=False, isHorizontalPossible=False, withBridges=False)
         if self.radiatorReferenceMass > 0:
             self.radiatorFraction = self.radiatorStructuralMass / self.radiatorReferenceMass
 
@@ -44,8 +65,8 @@ class Structure:
         else:
             maxRadius = lightRadius
             self.lightReferenceMass = lightMass
-        lightDistribution = {self.CircularEffectiveRadius(i, N, minRadius=0, maxRadius=maxRadius): self.lightReferenceMass / N for i in range(N)}
-        self.lightStructuralMass = self.ComputeStructuralMass(lightDistribution, isHorizontalPossible=True)
+        self.lightStructuralMass = self.ComputeSupportMass(self.lightReferenceMass, self.CircularEffectiveRadius(np.arange(N), N, minRadius=0, maxRadius=maxRadius),
+                                                           0, maxRadius, isCircular=True, isHorizontalPossible=True)
         if self.lightReferenceMass > 0:
             self.coRotationalLightFraction = self.lightReferenceMass / lightMass
             self.lightFraction = self.lightStructuralMass / self.lightReferenceMass
@@ -57,8 +78,8 @@ class Structure:
             maxRadius = electricRadius
             self.electricReferenceMass = electricMass
         if self.electricReferenceMass > 0:
-            electricDistribution = {self.CircularEffectiveRadius(i, N, minRadius=lightRadius, maxRadius=maxRadius): self.electricReferenceMass / N for i in range(N)}
-            self.electricStructuralMass = self.ComputeStructuralMass(electricDistribution, isHorizontalPossible=True)
+            self.electricStructuralMass = self.ComputeSupportMass(self.electricReferenceMass, self.CircularEffectiveRadius(np.arange(N), N, minRadius=lightRadius, maxRadius=maxRadius),
+                                                                  lightRadius, maxRadius, isCircular=True, isHorizontalPossible=True)
             self.coRotationalElectricFraction = self.electricReferenceMass / electricMass
             self.electricFraction = self.electricStructuralMass / self.electricReferenceMass
         else:
@@ -81,44 +102,116 @@ class Structure:
     def LinearEffectiveRadius(i, N, maxRadius):
         return maxRadius / N * (((i+1) ** 3 - i ** 3) / 3) ** .5
 
-    def ComputeStructuralMass(self, massdistribution: {float, float}, isHorizontalPossible: bool, withBridges: bool = True):
+    @staticmethod
+    def GetArrays(massDistribution):  # radii and masses of a {radius: mass} dict or a (radii, masses) tuple
+        if isinstance(massDistribution, dict):
+            return np.array(list(massDistribution.keys()), dtype=float), np.array(list(massDistribution.values()), dtype=float)
+        radii, masses = massDistribution
+        return np.asarray(radii, dtype=float), np.asarray(masses, dtype=float)
+
+    def ComputeStructuralMass(self, massDistribution, isHorizontalPossible: bool, withBridges: bool = True):
+        # massDistribution as (radii, masses) arrays (coincident radii allowed) or {radius: mass}
+        radii, masses = self.GetArrays(massDistribution)
+        return np.sum(self.ComputeStructuralFractions(radii, isHorizontalPossible, withBridges) * masses)
+
+    def ComputeStructuralFractions(self, radii, isHorizontalPossible: bool, withBridges: bool = True):
+        structuralFractions = self.ComputeVerticalStructuralFraction(radii, withBridges)
+        if isHorizontalPossible:
+            horizontalFractions = self.ComputeHorizontalStructuralFraction(radii)
+            structuralFractions = np.where(radii < self.coRotationalRadius, np.where(radii > 0.1 * self.coRotationalRadius,
+                np.minimum(horizontalFractions, structuralFractions), horizontalFractions), structuralFractions)
+        return structuralFractions
+
+    def ComputeSupportMass(self, mass, shellRadii, minRadius, maxRadius, isCircular: bool, isHorizontalPossible: bool, withBridges: bool = True):
+        # structural mass of a mass evenly distributed over the radius (or the area, if circular) from minRadius to maxRadius:
+        # on the shells, or by adaptive quadrature
+        N = len(shellRadii)
+        if not self.inp.isSupportAdaptive:
+            return self.ComputeStructuralMass((shellRadii, np.full(N, mass / N)), isHorizontalPossible, withBridges)
+        if mass == 0:
+            return 0
+        if maxRadius <= minRadius:
+            return mass * self.ComputeStructuralFractions(np.array([maxRadius]), isHorizontalPossible, withBridges)[0]
+        if isCircular:
+            getDensity = lambda r: 2 * r / (maxRadius ** 2 - minRadius ** 2)
+        else:
+            getDensity = lambda r: 1 / (maxRadius - minRadius)
+        bounds = [minRadius, maxRadius]
+        if isHorizontalPossible and minRadius < 0.1 * self.coRotationalRadius < maxRadius:  # discontinuous fraction
+            bounds.insert(1, 0.1 * self.coRotationalRadius)
         structuralMass = 0
-        for radius in massdistribution.keys():
-            if isHorizontalPossible and radius < self.coRotationalRadius:
-                structuralFraction = self.ComputeHorizontalStructuralFraction(radius)
-                if radius > 0.1 * self.coRotationalRadius:
-                    verticalStructuralFraction = self.ComputeVerticalStructuralFraction(radius, withBridges)
-                    structuralFraction = min(structuralFraction, verticalStructuralFraction)
-            else:
-                structuralFraction = self.ComputeVerticalStructuralFraction(radius, withBridges)
-
-            structuralMass += structuralFraction * massdistribution[radius]
+        for i in range(len(bounds) - 1):
+            integral, error, numberEvaluations = helpers.adaptiveSimpson(
+                lambda r: self.ComputeStructuralFractions(r, isHorizontalPossible, withBridges) * getDensity(r),
+                bounds[i], bounds[i + 1], self.inp.supportRelativeTolerance)
+            structuralMass += integral * mass
+            self.supportError += error * mass
+            self.supportEvaluations += numberEvaluations
         return structuralMass
 
-    def ComputeHorizontalStructuralFraction(self, radius: float):  # [m]
-        r = radius / self.coRotationalRadius
-        if r == 0:  # no support needed
-            return 0
-        elif r < 1:
-            return 1 / (r ** -2 - 1)
+    def ComputeHorizontalStructuralFraction(self, radius):  # [m], also for arrays
+        r = np.asarray(radius / self.coRotationalRadius, dtype=float)
+        with np.errstate(divide="ignore"):
+            return np.where(r < 1, r ** 2 / (1 - r ** 2), 1e200)  # = 1 / (r^-2 - 1), no support needed at r = 0
+
+    def ComputeVerticalStructuralFraction(self, radius, withBridges: bool = True):  # also for arrays
+        r = np.asarray(radius / self.coRotationalRadius, dtype=float)
+        if self.inp.isStructureTabulated:
+            verticalMassFraction = self.TabulatedVerticalMassFraction(np.minimum(r, 30))
         else:
-            return 1e200
+            verticalMassFraction = self.VerticalMassFraction(np.minimum(r, 30))
+        if withBridges:
+            gravity = r * self.coRotationalRadius / self.rotationalRadius * self.inp.maxGravity
+            bridgeMassFraction = gravity / self.inp.stressPerDensity / 6 * self.inp.distanceBetweenVerticalCables * \
+                                 (self.inp.distanceBetweenVerticalCables / self.inp.bridgeThickness + 1)
+            verticalMassFraction = bridgeMassFraction + verticalMassFraction * (1 + bridgeMassFraction)
+        return np.where(r > 30, 1e200, np.where(r == 0, 0, verticalMassFraction))  # avoid overflow, no support needed at r = 0
 
-    def ComputeVerticalStructuralFraction(self, radius: float, withBridges: bool = True):
-        r = radius / self.coRotationalRadius
-        if r == 0:  # no support needed
-            return 0
-        elif r > 30:
-            return 1e200  # avoid overflow
-        else:  # vertical support
-            verticalMassFraction = r * (math.pi / 2) ** .5 * math.exp(r ** 2 / 2) * math.erf(2 ** -.5 * r)
-            if withBridges:
-                gravity = r * self.coRotationalRadius / self.rotationalRadius * self.inp.maxGravity
-                bridgeMassFraction = gravity / self.inp.stressPerDensity / 6 * self.inp.distanceBetweenVerticalCables * \
-                                     (self.inp.distanceBetweenVerticalCables / self.inp.bridgeThickness + 1)
-                return bridgeMassFraction + verticalMassFraction * (1 + bridgeMassFraction)
-            else:
-                return verticalMassFraction
+    @staticmethod
+    def VerticalMassFraction(r):  # r (pi/2)^.5 exp(r²/2) erf(r/2^.5) = sum over n of r^(2n+2) / (2n+1)!!
+        shape = np.shape(r)
+        r = np.atleast_1d(np.asarray(r, dtype=float))
+        fraction = r * (math.pi / 2) ** .5 * np.exp(r ** 2 / 2)  # erf = 1 within double precision for r > 8.4
+        isSeries = r < 8.4
+        if np.any(isSeries):
+            maxSquared = np.max(r[isSeries]) ** 2  # the largest radius needs the most terms
+            numberTerms, term, series = 1, maxSquared, maxSquared
+            while term > 1e-17 * series:  # all terms positive, no cancellation
+                term *= maxSquared / (2 * numberTerms + 1)
+                series += term
+                numberTerms += 1
+            rSquared = r[isSeries] ** 2
+            term = rSquared.copy()
+            series = rSquared.copy()
+            for n in range(1, numberTerms):
+                term *= rSquared / (2 * n + 1)
+                series += term
+            fraction[isSeries] = series
+        return fraction.reshape(shape)
+
+    @classmethod
+    def GetTable(cls):
+        if cls.table is None:
+            radii = np.arange(0, 30 + cls.tableStep / 2, cls.tableStep)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                g = cls.VerticalMassFraction(radii) / radii ** 2 / np.exp(radii ** 2 / 2)
+                derivatives = (np.exp(-radii ** 2 / 2) - g) / radii  # from f' = f (1/r + r) + r
+            g[0], derivatives[0] = 1, 0
+            cls.table = radii, g, derivatives
+            midpoints = radii[:-1] + cls.tableStep / 2
+            exact = cls.VerticalMassFraction(midpoints)
+            cls.tableError = np.max(np.abs(cls.TabulatedVerticalMassFraction(midpoints) / exact - 1))
+        return cls.table
+
+    @classmethod
+    def TabulatedVerticalMassFraction(cls, r):  # r up to 30
+        radii, g, derivatives = cls.GetTable()
+        r = np.asarray(r, dtype=float)
+        i = np.minimum((r / cls.tableStep).astype(int), len(radii) - 2)
+        t = r / cls.tableStep - i
+        interpolated = (1 + 2 * t) * (1 - t) ** 2 * g[i] + t * (1 - t) ** 2 * cls.tableStep * derivatives[i] \
+            + t ** 2 * (3 - 2 * t) * g[i + 1] + t ** 2 * (t - 1) * cls.tableStep * derivatives[i + 1]
+        return r ** 2 * interpolated * np.exp(r ** 2 / 2)
 
     def ComputeStructuralFractionWithoutSelfWeight(self, radius: float):
         if radius == 0:  # no support needed
@@ -0,0 +1,42 @@
+import unittest
+
+from batch import HabitatBatch
+from habitat import Habitat
+from helpers import CoolantType, LogRange, ShapeType
+from input import Input
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.inp = Input()
+        self.powers = [pop * self.inp.powerPerPerson for pop in LogRange(20, 1e3 / 4e4, 1e16 / 4e4)]
+
+    def assert_consistent(self):
+        results = HabitatBatch(self.inp, self.powers, .01, .01, .01, 100).results
+        for i, power in enumerate(self.powers):
+            hab = Habitat(self.inp, power, .01, .01, .01, 100)
+            self.assertAlmostEqual(results["shape.rotationalRadius"][i] / hab.shape.rotationalRadius, 1, 12)
+            self.assertAlmostEqual(results["lightCollection.lightMass"][i] / hab.lightCollection.lightMass, 1, 12)
+            self.assertAlmostEqual(results["emission.emissionSurface"][i] / hab.emission.emissionSurface, 1, 12)
+            self.assertAlmostEqual(results["connection.connectionVelocity"][i] / hab.connection.connectionVelocity, 1, 12)
+            self.assertAlmostEqual(results["totalCoolingMass"][i] / hab.totalCoolingMass, 1, 12)
+            self.assertAlmostEqual(results["electricMass"][i] / hab.electricMass, 1, 12)
+            self.assertEqual(results["absorption.numberIterations"][i], hab.absorption.numberIterations)
+            self.assertEqual(results["isCoolingPossible"][i], hab.isCoolingPossible)
+            self.assertEqual(results["isCompleteLighting"][i], hab.isCompleteLighting)
+
+    def test_liquid(self):
+        self.assert_consistent()
+
+    def test_vapor(self):
+        self.inp.coolantType = CoolantType.Vapor
+        self.assert_consistent()
+
+    def test_air(self):
+        self.inp.coolantType = CoolantType.Air
+        self.assert_consistent()
+
+    def test_shapes(self):
+        for shapeType in ShapeType:
+            self.inp.shapeType = shapeType
+            self.assert_consistent()
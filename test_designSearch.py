@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from designSearch import DesignSearch, evaluateDesign
+from habitat import Habitat
+from helpers import ShapeType
+from input import Input
+
+
+class TestDesignSearch(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.statePath = os.path.join(self.directory.name, "designSearch.json")
+        self.inp = Input()
+        self.inp.numberProcesses = 1
+        self.inp.designShapeTypes = [ShapeType.Cylinder, ShapeType.Dumbbell]
+        self.inp.designRefinements = 2
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_evaluation(self):
+        record = evaluateDesign(self.inp, 1e4, ShapeType.Torus, {"torusHabToRotRadius": 0.1})
+        self.inp.shapeType = ShapeType.Torus
+        self.inp.torusHabToRotRadius = 0.1
+        hab = Habitat(self.inp, 1e4 * self.inp.powerPerPerson, self.inp.absorptionFrictionFraction,
+                      self.inp.connectionFrictionFraction, self.inp.emissionFrictionFraction)
+        self.assertEqual(record["massPerPerson"], hab.totalMass / 1e4)
+
+    def test_search(self):
+        search = DesignSearch(self.inp, 1e4, self.statePath)
+        designs = search.run()
+        for shapeType, (ratios, record) in designs.items():
+            self.assertTrue(search.isFeasible(record))
+            for ratios2, record2 in [(dict(key[1]), record2) for key, record2 in search.evaluations.items() if key[0] == shapeType.name]:
+                if search.isFeasible(record2):
+                    self.assertLessEqual(record["massPerPerson"], record2["massPerPerson"])
+        self.assertEqual(search.getBest(designs)[0], min(designs, key=lambda shapeType: designs[shapeType][1]["massPerPerson"]))
+
+    def test_resume(self):
+        search = DesignSearch(self.inp, 1e4, self.statePath)
+        designs = search.run()
+        resumed = DesignSearch(self.inp, 1e4, self.statePath)
+        self.assertEqual(resumed.run(), designs)
+        self.assertEqual(resumed.numberComputed, 0)
+        self.inp.designRefinements = 3  # the search continues with the stored evaluations
+        refined = DesignSearch(self.inp, 1e4, self.statePath)
+        refined.run()
+        self.assertLess(refined.numberComputed, len(refined.evaluations) / 2)
+
+        self.inp.emissivity = 0.5  # stored evaluations are not valid for another input
+        self.assertEqual(len(DesignSearch(self.inp, 1e4, self.statePath).evaluations), 0)
+        self.assertEqual(len(DesignSearch(Input(), 1e5, self.statePath).evaluations), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
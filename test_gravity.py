@@ -89,3 +89,22 @@ class TestGravity(unittest.TestCase):
         self.assertAlmostEqual(gravity.averageVolumetricGravity, 5.61, 2)
         self.assertAlmostEqual(gravity.averageGroundGravity, 5.81, 2)
         self.assertAlmostEqual(gravity.averageHullGravity, 5.31, 2)
+
+    def test_arrays(self):
+        self.inp.shapeType = ShapeType.DumbbellTube
+        self.inp.dumbbellMinorToRotRadius = 0.2
+        self.inp.dumbbellMajorToMinorRadius = 1.5
+        self.inp.tubeRadiusToRotRadius = 0.05
+
+        gravity = Gravity(self.inp, 100, 80)
+        radii = [1, 5, 30, 60, 79, 95, 99.9]
+        groundAreas = gravity.GroundArea(radii)
+        hullLengths = gravity.HullOrientedLength(radii)
+        for i in range(len(radii)):
+            self.assertAlmostEqual(groundAreas[i], gravity.GroundArea(radii[i]), 10)
+            self.assertAlmostEqual(hullLengths[i], gravity.HullOrientedLength(radii[i]), 10)
+        for i in range(len(gravity.groundRadii)):  # the floors of all radii at once, as by a floor after the other
+            height = gravity.NextFloorHeight(gravity.groundRadii[i])
+            floorRadius = (gravity.groundRadii[i] + max(gravity.groundRadii[i] - height, 0)) / 2
+            self.assertAlmostEqual(gravity.floorVolumes[i], height * gravity.GroundArea(floorRadius), 6)
+            self.assertAlmostEqual(gravity.hullAreas[i], height * gravity.HullOrientedLength(floorRadius), 6)
@@ -17,6 +17,11 @@ class TestHabitat(unittest.TestCase):
         res = Habitat(self.inp, 1e10, .01, .01, .01)
         self.assertAlmostEqual(math.log10(res.totalCoolingMass), 8.964883982294, 12)
 
+    def test_slots(self):
+        res = Habitat(self.inp, 1e10, .01, .01, .01)
+        for component in [res, res.shape, res.lightCollection, res.absorption, res.emission, res.connection, res.structure, res.gravity]:
+            self.assertFalse(hasattr(component, "__dict__"))
+
     def test_shape_gravity(self):
         self.are_shape_gravity_consistent(ShapeType.Cylinder)
         self.are_shape_gravity_consistent(ShapeType.Tube)
@@ -38,3 +43,19 @@ class TestHabitat(unittest.TestCase):
         self.assertLess(abs(1 - volumeGravToShapeRatio), 0.1)
         self.assertLess(abs(1 - hullGravToShapeRatio), 0.1)
 
+    def test_gravity_bins(self):
+        self.inp.constantFloorHeight = 5
+        self.inp.variableFloorHeight = 5
+        hab = Habitat(self.inp, 4e14, .01, .01, .01, 100)
+        self.inp.numberGravityBins = 100
+        binnedHab = Habitat(self.inp, 4e14, .01, .01, .01, 100)
+        self.assertLess(abs(binnedHab.structure.interiorStructuralMass / hab.structure.interiorStructuralMass - 1), 1e-3)
+        self.assertLess(abs(binnedHab.structure.hullStructuralMass / hab.structure.hullStructuralMass - 1), 1e-3)
+
+        gravity = hab.gravity
+        radii, areas = gravity.BinnedDistribution(gravity.groundRadii, gravity.groundAreas, 10)
+        self.assertEqual(len(radii), 10)
+        self.assertAlmostEqual(sum(areas) / sum(gravity.groundAreas), 1, 12)
+        self.assertAlmostEqual(sum(areas * radii) / sum(areas) / gravity.rotationalRadius * self.inp.maxGravity,
+                               gravity.averageGroundGravity, 10)
+
@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+
+from helpers import CoolantType, CoolingHelper, LogRange, frictionFactor
+from input import Input
+
+
+class TestHelpers(unittest.TestCase):
+    def setUp(self):
+        self.inp = Input()
+
+    def test_shared_cooling_helper(self):
+        coolingHelper = CoolingHelper.getForInput(self.inp)
+        self.assertIs(CoolingHelper.getForInput(self.inp), coolingHelper)
+        self.assertIsNot(CoolingHelper.getForInput(Input()), coolingHelper)
+
+        self.inp.emissivity = 0.5  # not a coolant parameter
+        self.assertIs(CoolingHelper.getForInput(self.inp), coolingHelper)
+
+        self.inp.coolantType = CoolantType.Vapor
+        vaporHelper = CoolingHelper.getForInput(self.inp)
+        self.assertIsNot(vaporHelper, coolingHelper)
+        self.assertEqual(vaporHelper.coolantDensity, CoolingHelper(self.inp).coolantDensity)
+
+    def test_friction_factor(self):
+        reynolds = np.array([0, 1e3, 2299, 2300, 1e5, 1e9])
+        factors = frictionFactor(reynolds, 0.005)
+        for i in range(len(reynolds)):
+            self.assertEqual(factors[i], frictionFactor(float(reynolds[i]), 0.005))
+        self.assertEqual(frictionFactor(reynolds.reshape(2, 3), 0.005).shape, (2, 3))
+        self.assertEqual(frictionFactor(1e9, 0.005), 0.005)
+
+    def test_log_range(self):
+        values = LogRange(500, 1e3 / 4e4, 1e18 / 4e4)
+        self.assertIsInstance(values, list)
+        self.assertEqual(len(values), 500)
+        self.assertEqual(values[0], 1e3 / 4e4)
+        self.assertEqual(values[-1], 1e18 / 4e4)
+        self.assertAlmostEqual(values[1] / values[0], values[-1] / values[-2], 12)
+        self.assertEqual(LogRange(1, 5, 10), [5])
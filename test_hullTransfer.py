@@ -0,0 +1,73 @@
+import unittest
+
+import numpy as np
+
+from helpers import SolverType, brentRoot
+from hullTransfer import HullTransfer
+from input import Input
+
+
+class TestHullTransfer(unittest.TestCase):
+    def setUp(self):
+        self.inp = Input()
+        self.inp.hullSurfaceAbsorptivity = 0.1
+        HullTransfer.cache.clear()
+
+    def test_cache(self):
+        powerPerSurface = HullTransfer.getPowerPerSurface(self.inp, 0.2)
+        self.assertAlmostEqual(powerPerSurface, HullTransfer(self.inp, 0.2).powerPerSurface, 12)
+        self.assertEqual(len(HullTransfer.cache), 1)
+        self.assertEqual(HullTransfer.getPowerPerSurface(self.inp, 0.2 + 1e-9), powerPerSurface)
+        self.assertEqual(len(HullTransfer.cache), 1)
+
+        self.inp.hullConductivity = 2
+        self.assertNotEqual(HullTransfer.getPowerPerSurface(self.inp, 0.2), powerPerSurface)
+        self.assertEqual(len(HullTransfer.cache), 2)
+
+    def test_cache_size(self):
+        cacheSize = HullTransfer.cacheSize
+        HullTransfer.cacheSize = 3
+        for i in range(5):
+            HullTransfer.getPowerPerSurface(self.inp, 0.1 * (i + 1))
+        self.assertEqual(len(HullTransfer.cache), 3)
+        self.assertEqual(list(HullTransfer.cache.keys())[0][1], 0.3)
+        HullTransfer.cacheSize = cacheSize
+
+    def test_warm_start(self):
+        coldStart = HullTransfer(self.inp, 0.21)
+        warmStart = HullTransfer(self.inp, 0.21, HullTransfer(self.inp, 0.2).powerPerSurface)
+        self.assertLess(warmStart.numberIterations, coldStart.numberIterations)
+        self.assertAlmostEqual(warmStart.powerPerSurface, coldStart.powerPerSurface, 0)
+
+    def test_brent(self):
+        damped = HullTransfer(self.inp, 0.2)
+        self.inp.hullSolver = SolverType.Brent
+        self.inp.hullRelativeTolerance = 1e-8
+        brent = HullTransfer(self.inp, 0.2)
+        self.assertAlmostEqual(brent.powerPerSurface, damped.powerPerSurface, 0)
+        self.assertLess(abs(brent.transmittedPower(brent.powerPerSurface) / brent.powerPerSurface - 1), 1e-6)
+        self.assertLess(brent.numberIterations, 30)
+
+        self.inp.hullSurfaceAbsorptivity = 0.5
+        self.inp.hullSurfaceDensity = 5000
+        self.assertLess(HullTransfer(self.inp, 0.2).numberIterations, 30)
+
+    def test_brent_root(self):
+        root, numberEvaluations = brentRoot(lambda x: x ** 3 - 2, 0, 5, 1e-12)
+        self.assertAlmostEqual(root, 2 ** (1 / 3), 10)
+        self.assertLess(numberEvaluations, 20)
+
+    def test_gap_radiation(self):
+        hullTransfer = HullTransfer(self.inp, 0.2)
+        for e1, e2 in [(0.9, 0.9), (0.5, 0.2), (0.05, 0.05)]:
+            resistance, emissivity, numberReflections = hullTransfer.gapRadiation(280, 279, e1, e2)
+            exactResistance, exactEmissivity, noReflections = hullTransfer.gapRadiation(280, 279, e1, e2, isExact=True)
+            self.assertLess(abs(exactEmissivity / emissivity - 1), 0.01)
+            self.assertLess(abs(exactResistance / resistance - 1), 0.01)
+            self.assertEqual(noReflections, 0)
+        self.assertGreater(numberReflections, 30)
+
+        temperatures = np.array([200., 250., 300.])
+        resistances, emissivity, numberReflections = hullTransfer.gapRadiation(temperatures, temperatures - 1, 0.9, 0.5, isExact=True)
+        for i in range(len(temperatures)):
+            self.assertAlmostEqual(resistances[i], hullTransfer.gapRadiation(temperatures[i], temperatures[i] - 1, 0.9, 0.5, True)[0], 12)
@@ -0,0 +1,37 @@
+import unittest
+
+import limits
+import runner
+from helpers import LogRange
+from input import Input
+from results import SweepResults
+
+
+class TestLimits(unittest.TestCase):
+    def setUp(self):
+        self.inp = Input()
+        self.inp.population = LogRange(30, 1e3 / 4e4, 1e18 / 4e4)
+        self.habitats = runner.computeSizes(self.inp)
+        self.results = SweepResults.fromHabitats(0, self.habitats)
+
+    def test_columns(self):
+        detector = limits.LimitDetector()
+        for hab in self.habitats:
+            detector.update(limits.HabitatValues(hab))
+        self.assertEqual(limits.findLimits(self.results, self.habitats), detector.getMessages())
+        self.assertEqual(len(detector.getMessages()), 11)
+
+        fromColumns = limits.findLimits(self.results)
+        self.assertIn("No complete lighting above pop. 5.5e+08 / 8.8e+11 m³ / 2.2e+13 W", fromColumns)  # without report
+        self.assertEqual(fromColumns[0], detector.getMessages()[0])
+
+    def test_refined(self):
+        hullPowerPerSurface = runner.getHullPowerPerSurface(self.inp, self.inp.population)
+        computeHabitat = lambda pop: runner.computeHabitat(self.inp, pop, hullPowerPerSurface)
+        name, isReached, getMessage = limits.limits[6]  # lighting
+        index = int(self.results["isCompleteLighting"].argmin())
+        hab = limits.bisectLimit(lambda hab: isReached(limits.HabitatValues(hab)), computeHabitat,
+                                 self.inp.population[index - 1], self.inp.population[index], 1e-4)
+        self.assertFalse(hab.isCompleteLighting)
+        self.assertTrue(computeHabitat(hab.population / (1 + 1e-4)).isCompleteLighting)
+        self.assertIn(getMessage(limits.HabitatValues(hab)), limits.findLimits(self.results, self.habitats, computeHabitat, 1e-4))
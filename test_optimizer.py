@@ -0,0 +1,63 @@
+import unittest
+
+import optimizer
+import runner
+from cooling import CoolingEvaluator
+from habitat import Habitat
+from helpers import CoolantType, OptimizerType, LogRange
+from input import Input
+from results import SweepResults
+
+
+class TestOptimizer(unittest.TestCase):
+    def setUp(self):
+        self.inp = Input()
+
+    def test_cooling_evaluator(self):
+        evaluator = CoolingEvaluator(self.inp, 4e9, 0.01, 0.01, 0.01, 20)
+        self.assertFalse(hasattr(evaluator.startHabitat, "structure"))
+        res = evaluator.evaluate(0.02, 0.03, 0.04)
+        full = Habitat(self.inp, 4e9, 0.02, 0.03, 0.04, 20)
+        self.assertEqual(res.totalCoolingMass, full.totalCoolingMass)
+        self.assertEqual(evaluator.complete(res).totalMass, full.totalMass)
+        self.assertEqual(evaluator.startHabitat.totalCoolingMass, Habitat(self.inp, 4e9, 0.01, 0.01, 0.01, 20).totalCoolingMass)
+        self.assertEqual(evaluator.numberEvaluations, 2)
+
+    def test_single_step(self):
+        res = optimizer.getOptimizedResult(self.inp, 4e9, 20)
+        self.assertEqual((res.frictionIterations, res.frictionEvaluations), (1, 2))
+
+    def test_no_cooling_power(self):
+        self.inp.windowAbsorptivity = 0
+        self.inp.isFrictionOptimized = True
+        res = optimizer.getOptimizedResult(self.inp, 1e3, 20)
+        self.assertEqual(res.coolingPower, 0)
+        self.assertEqual((res.frictionIterations, res.frictionEvaluations), (0, 1))
+        self.assertIn("frictionIterations", SweepResults.getNames(res))
+
+    def test_iterated(self):
+        for coolantType in CoolantType:
+            self.inp.coolantType = coolantType
+            for power in [4e6, 4e9, 4e12]:
+                self.inp.frictionOptimizer = OptimizerType.SingleStep
+                singleStep = optimizer.getOptimizedResult(self.inp, power, 20)
+                self.inp.frictionOptimizer = OptimizerType.Iterated
+                iterated = optimizer.getOptimizedResult(self.inp, power, 20)
+                self.assertLessEqual(iterated.totalCoolingMass, singleStep.totalCoolingMass * (1 + 1e-12))
+                self.assertLess(iterated.frictionIterations, self.inp.maxFrictionIterations)
+                self.assertEqual(iterated.frictionEvaluations, iterated.frictionIterations + 1)
+
+    def test_warm_start(self):
+        self.inp.isFrictionOptimized = True
+        self.inp.frictionOptimizer = OptimizerType.Iterated
+        self.inp.population = LogRange(numberOfModels=30, minValue=1e2, maxValue=1e8)
+        cold = runner.computeSweep(self.inp)
+        self.inp.isFrictionWarmStarted = True
+        warm = runner.computeSweep(self.inp)
+        self.assertLess(sum(res.frictionEvaluations for res in warm), sum(res.frictionEvaluations for res in cold))
+        for coldRes, warmRes in zip(cold, warm):
+            self.assertAlmostEqual(warmRes.totalCoolingMass / coldRes.totalCoolingMass, 1, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import runner
+from helpers import LogRange, ShapeType
+from input import Input
+from output import Output
+
+
+class ShapesInput(Input):  # the shape of the first run is the default one, as in M/input.py
+    def changeParameters(self, iRun):
+        self.iRun = iRun
+        if iRun == 0:
+            self.label.append("Cylinder")
+        elif iRun == 1:
+            self.shapeType = ShapeType.Dumbbell
+            self.dumbbellMajorToMinorRadius = 2 ** (1 / 3)
+            self.label.append("Asymmetric Dumbbell")
+
+
+class TestOutput(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.inp = Input()
+        self.inp.project = self.directory.name
+        self.inp.population = LogRange(numberOfModels=5, minValue=1e2, maxValue=1e6)
+        Output.isHeadless = True
+
+    def tearDown(self):
+        Output.isHeadless = False
+        Output.tableFormat = "csv"
+        self.directory.cleanup()
+
+    def test_csv(self):
+        runResults = runner.computeRuns(self.inp)
+        Output(self.inp, runResults)
+        with open(os.path.join(self.inp.project, "results_run0.csv")) as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), 5)
+        for row, hab in zip(rows, runResults[0]):
+            self.assertEqual(float(row["totalMass"]), hab.totalMass)
+            self.assertEqual(float(row["structure.totalStructuralMass"]), hab.structure.totalStructuralMass)
+            self.assertEqual(row["isCoolingPossible"], str(hab.isCoolingPossible))
+
+    def test_json(self):
+        Output.tableFormat = "json"
+        self.inp.isBatchComputed = True
+        runResults = runner.computeRuns(self.inp)
+        Output(self.inp, runResults)
+        with open(os.path.join(self.inp.project, "results_run0.json")) as file:
+            table = json.load(file)
+        self.assertEqual(table["iRun"], 0)
+        self.assertEqual(table["columns"]["totalCoolingMass"], runResults[0]["totalCoolingMass"].tolist())
+
+    def getRunInput(self, iRun):  # built from a new input, as without any other run
+        runInp = ShapesInput()
+        runInp.label = []
+        for i in range(iRun + 1):
+            runInp.changeParameters(i)
+        return runInp
+
+    def test_refined_runs(self):
+        inp = ShapesInput()
+        inp.project = self.directory.name
+        inp.population = LogRange(numberOfModels=8, minValue=1e3 / 4e4, maxValue=1e18 / 4e4)
+        inp.numberRuns = 2
+        inp.label = []
+        inp.isLimitRefined = True
+        inp.limitRelativeTolerance = 1e-2
+        runResults = runner.computeRuns(inp)
+        with mock.patch("runner.computeHabitat", wraps=runner.computeHabitat) as computeHabitat:
+            Output(inp, runResults)
+        refinedRuns = set()
+        for call in computeHabitat.call_args_list:
+            runInp, pop, hullPowerPerSurface = call.args[:3]
+            refinedRuns.add(runInp.iRun)
+            shape = runner.computeHabitat(runInp, pop, hullPowerPerSurface).shape
+            expectedShape = runner.computeHabitat(self.getRunInput(runInp.iRun), pop, hullPowerPerSurface).shape
+            self.assertEqual(shape.shapeType, expectedShape.shapeType)
+            self.assertEqual(shape.rotationalRadius, expectedShape.rotationalRadius)
+            self.assertEqual(shape.hullSurface, expectedShape.hullSurface)
+        self.assertEqual(refinedRuns, {0, 1})
+        self.assertEqual(self.getRunInput(0).shapeType, ShapeType.Cylinder)
@@ -0,0 +1,78 @@
+import csv
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import runner
+from limits import HabitatValues, LimitDetector
+from input import Input
+from results import SweepResults
+from snapshot import InputSnapshot
+
+
+class TestRunner(unittest.TestCase):
+    def setUp(self):
+        self.inp = Input()
+        self.inp.numberRuns = 6
+        self.inp.label = []
+
+    def test_run_input(self):
+        runInp = runner.getRunInput(self.inp, 3)
+        self.assertEqual(runInp.label, ["XS - Dumbbell", "S - Tube", "M - Torus", "L - Asymmetric Dumbbell with Tube"])
+        self.assertEqual(runInp.population, 1e6)
+        self.assertEqual(self.inp.label, [])
+        self.assertEqual(runner.getRunInput(self.inp, 5).dumbbellMajorToMinorRadius, 2 ** (1 / 3))  # kept from run 3
+
+    def test_repeated(self):
+        self.inp.population = [1e2, 1e4]
+        self.inp.numberRuns = 2
+        runner.computeRuns(self.inp)
+        digests = [InputSnapshot(runInp).digest for runInp in self.inp.runInputs]
+        self.inp.label = []
+        runner.computeRuns(self.inp)
+        self.assertFalse(hasattr(self.inp.runInputs[1], "runInputs"))
+        self.assertEqual([InputSnapshot(runInp).digest for runInp in self.inp.runInputs], digests)
+        self.assertNotIn("runInputs", InputSnapshot(self.inp).fields)
+
+    def test_parallel(self):
+        self.inp.numberProcesses = 1
+        serialResults = runner.computeRuns(self.inp)
+        self.setUp()
+        self.inp.numberProcesses = 2
+        parallelResults = runner.computeRuns(self.inp)
+        self.assertEqual(len(parallelResults), 6)
+        self.assertEqual(len(self.inp.label), 6)
+        for serial, parallel in zip(serialResults, parallelResults):
+            self.assertEqual(parallel[0].iRun, serial[0].iRun)
+            self.assertEqual(parallel[0].totalMass, serial[0].totalMass)
+
+    def test_compact(self):
+        self.inp.population = [1e2, 1e4, 1e6]
+        habitats = runner.computeSizes(self.inp)
+        self.inp.isResultCompact = True
+        results = runner.computeSizes(self.inp)
+        self.assertIsInstance(results, SweepResults)
+        self.assertEqual(len(results), 3)
+        np.testing.assert_array_equal(results["totalMass"], [hab.totalMass for hab in habitats])
+        np.testing.assert_array_equal(results["structure.hullFraction"], [hab.structure.hullFraction for hab in habitats])
+        self.assertEqual(results["isCoolingPossible"].dtype, bool)
+        self.assertEqual(results.firstHabitat.gravity.numberFloors, habitats[0].gravity.numberFloors)
+
+    def test_stream(self):
+        self.inp.population = [1e2, 1e4, 1e6, 1e8, 1e10]
+        habitats = runner.computeSizes(self.inp)
+        with tempfile.TemporaryDirectory() as directory:
+            self.inp.project = directory
+            detector = runner.streamSizes(self.inp)
+            with open(os.path.join(directory, "sweep_run0.csv")) as file:
+                rows = list(csv.DictReader(file))
+        self.assertEqual([float(row["totalMass"]) for row in rows], [hab.totalMass for hab in habitats])
+        self.assertEqual([row["isCompleteLighting"] for row in rows], [str(hab.isCompleteLighting) for hab in habitats])
+
+        expected = LimitDetector()
+        for hab in habitats:
+            expected.update(HabitatValues(hab))
+        self.assertEqual(detector.getMessages(), expected.getMessages())
+        self.assertIn("Hull mass is larger than interior mass (1.0e+11 kg) below pop. 1.0e+06 / 1.6e+09 m³ / 4.0e+10 W", detector.getMessages())
@@ -0,0 +1,45 @@
+import math
+import unittest
+
+import numpy as np
+
+import runner
+from input import Input
+from results import SweepResults
+
+
+class TestSampler(unittest.TestCase):
+    def setUp(self):
+        self.inp = Input()
+        self.inp.isPopulationAdaptive = True
+        self.inp.adaptiveInitialSizes = 10
+        self.inp.adaptiveEvaluations = 40
+
+    def test_adaptive(self):
+        habitats = runner.computeSizes(self.inp)
+        self.assertEqual(len(habitats), 40)
+        pops = np.array([hab.population for hab in habitats])
+        self.assertTrue(np.all(np.diff(pops) > 0))
+        self.assertAlmostEqual(pops[0], min(self.inp.population))
+        self.assertAlmostEqual(pops[-1], max(self.inp.population))
+
+        initialStep = math.log10(pops[-1] / pops[0]) / (self.inp.adaptiveInitialSizes - 1)
+        index = int(np.argmin([hab.isCompleteLighting for hab in habitats]))  # regime change refined
+        self.assertLess(math.log10(pops[index] / pops[index - 1]), initialStep / 3)
+
+    def test_budget(self):
+        self.inp.adaptiveInitialSizes = 30
+        self.inp.adaptiveEvaluations = 10
+        self.assertEqual(len(runner.computeSizes(self.inp)), 10)
+        self.inp.adaptiveInitialSizes = 1
+        habitats = runner.computeSizes(self.inp)
+        self.assertEqual(len(habitats), 10)
+        self.assertAlmostEqual(habitats[0].population, min(self.inp.population))
+        self.assertAlmostEqual(habitats[-1].population, max(self.inp.population))
+
+    def test_compact(self):
+        self.inp.isResultCompact = True
+        results = runner.computeSizes(self.inp)
+        self.assertIsInstance(results, SweepResults)
+        self.assertEqual(len(results), 40)
+        self.assertEqual(results.firstHabitat.population, results["population"][0])
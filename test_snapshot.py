@@ -0,0 +1,54 @@
+import unittest
+
+from helpers import ShapeType
+from hullTransfer import HullTransfer
+from input import Input
+from shape import Shape
+from snapshot import InputSnapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.inp = Input()
+
+    def test_equality(self):
+        snapshot = InputSnapshot(self.inp)
+        self.assertEqual(snapshot, InputSnapshot(Input()))
+        self.assertEqual(hash(snapshot), hash(InputSnapshot(Input())))
+        self.assertEqual(snapshot.digest, InputSnapshot(Input()).digest)
+
+        self.inp.population = [1, 10]  # lists are frozen
+        self.inp.iRun = 3  # run bookkeeping is ignored
+        self.assertEqual(InputSnapshot(self.inp), InputSnapshot(self.inp))
+        self.assertNotEqual(InputSnapshot(self.inp), snapshot)
+        self.assertNotEqual(InputSnapshot(self.inp).digest, snapshot.digest)
+
+    def test_immutable(self):
+        snapshot = InputSnapshot(self.inp)
+        with self.assertRaises(AttributeError):
+            snapshot.emissivity = 0.5
+        self.inp.emissivity = 0.5
+        self.assertNotEqual(snapshot.emissivity, 0.5)
+        self.assertEqual(snapshot.getIrradiation(), Input().getIrradiation())
+
+    def test_changed_fields(self):
+        snapshot = InputSnapshot(self.inp)
+        self.inp.shapeType = ShapeType.Torus
+        self.inp.emissivity = 0.5
+        changed = InputSnapshot(self.inp)
+        self.assertEqual(changed.changedFields(snapshot), ["emissivity", "shapeType"])
+        self.assertEqual(changed.changedSubsystems(snapshot, [Shape, HullTransfer]), [Shape, HullTransfer])
+        self.assertEqual(changed.key(Shape.inputFields)[0], ShapeType.Torus)
+
+    def test_shared_shape(self):
+        shape = Shape.getForVolume(self.inp, 1e6)
+        self.assertIs(Shape.getForVolume(Input(), 1e6), shape)
+        self.assertEqual(shape.hullMass, Shape(self.inp, 1e6).hullMass)
+        self.inp.emissivity = 0.5  # not a shape parameter
+        self.assertIs(Shape.getForVolume(self.inp, 1e6), shape)
+        self.inp.shapeType = ShapeType.Torus
+        self.assertIsNot(Shape.getForVolume(self.inp, 1e6), shape)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import tempfile
+import unittest
+
+import numpy as np
+
+import runner
+from helpers import LogRange
+from input import Input
+from results import SweepResults
+from store import ResultStore
+
+
+class TestStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.inp = Input()
+        self.inp.project = self.directory.name
+        self.inp.population = LogRange(numberOfModels=5, minValue=1e2, maxValue=1e6)
+        self.inp.isResultStored = True
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_reload(self):
+        habitats = runner.computeSizes(self.inp)
+        stored = ResultStore(self.inp.project).load(self.inp)
+        self.assertIsInstance(stored, SweepResults)
+        np.testing.assert_array_equal(stored["totalCoolingMass"], [hab.totalCoolingMass for hab in habitats])
+        np.testing.assert_array_equal(stored["shape.hullMass"], [hab.shape.hullMass for hab in habitats])
+        np.testing.assert_array_equal(stored["structure.totalStructuralMass"], [hab.structure.totalStructuralMass for hab in habitats])
+
+        reloaded = runner.computeSizes(self.inp)
+        self.assertIsInstance(reloaded, SweepResults)
+        np.testing.assert_array_equal(reloaded["habPower"], stored["habPower"])
+
+    def test_changed_input(self):
+        store = ResultStore(self.inp.project)
+        runner.computeSizes(self.inp)
+        self.inp.emissivity = 0.5
+        self.assertIsNone(store.load(self.inp))
+        self.inp.emissivity = Input.emissivity
+        self.inp.population = LogRange(numberOfModels=6, minValue=1e2, maxValue=1e6)
+        self.assertIsNone(store.load(self.inp))
+
+    def test_batch(self):
+        self.inp.isBatchComputed = True
+        batch = runner.computeSizes(self.inp)
+        stored = ResultStore(self.inp.project).load(self.inp)
+        self.assertEqual(set(stored.columns), set(batch.columns))
+        np.testing.assert_array_equal(stored["totalCoolingMass"], batch["totalCoolingMass"])
+
+
+if __name__ == '__main__':
+    unittest.main()
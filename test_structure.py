@@ -1,4 +1,8 @@
+import math
 import unittest
+
+import numpy as np
+
 from structure import Structure
 from input import Input
 
@@ -95,6 +99,47 @@ class TestStructure(unittest.TestCase):
         frac = structure.ComputeStructuralMass(distr, isHorizontalPossible=True) / sum(distr.values())
         self.assertAlmostEqual(frac, 3.811, 3)
 
+    def test_arrays(self):
+        self.inp.distanceBetweenVerticalCables = 10
+        structure = Structure(self.inp, rotationalRadius=10)
+        radii = structure.coRotationalRadius * np.array([0, 0.05, 0.1, 0.5, 0.9, 1, 2, 8, 9, 40])
+        fractions = structure.ComputeVerticalStructuralFraction(radii)
+        for radius, fraction in zip(radii, fractions):
+            self.assertEqual(structure.ComputeVerticalStructuralFraction(radius), fraction)
+        r = radii[1:-1] / structure.coRotationalRadius
+        exact = r * (math.pi / 2) ** .5 * np.exp(r ** 2 / 2) * np.array([math.erf(2 ** -.5 * x) for x in r])
+        np.testing.assert_allclose(structure.VerticalMassFraction(r), exact, rtol=1e-14)
+
+        distr = {radius: 1 for radius in radii[:-1]}
+        self.assertAlmostEqual(structure.ComputeStructuralMass((radii[:-1], np.ones(9)), isHorizontalPossible=True),
+                               structure.ComputeStructuralMass(distr, isHorizontalPossible=True), 10)
+
+        # coincident radii are not merged
+        mass = structure.ComputeStructuralMass(([100, 100], [1, 2]), isHorizontalPossible=False)
+        self.assertAlmostEqual(mass, 3 * structure.ComputeVerticalStructuralFraction(100), 12)
+
+    def test_adaptive_support(self):
+        arguments = dict(rotationalRadius=10, radiatorMass=1, radiatorRadius=300, lightMass=1, lightRadius=100, electricMass=1, electricRadius=400)
+        shells = Structure(self.inp, N=100000, **arguments)
+        self.assertTrue(math.isnan(shells.supportError))
+        self.inp.isSupportAdaptive = True
+        self.inp.supportRelativeTolerance = 1e-8
+        adaptive = Structure(self.inp, **arguments)
+        for name in ["radiatorStructuralMass", "lightStructuralMass", "electricStructuralMass"]:
+            self.assertAlmostEqual(getattr(adaptive, name) / getattr(shells, name), 1, 8)
+        total = adaptive.radiatorStructuralMass + adaptive.lightStructuralMass + adaptive.electricStructuralMass
+        self.assertLess(adaptive.supportError, 1e-7 * total)
+        self.assertLess(adaptive.supportEvaluations, 1000)
+
+    def test_table(self):
+        r = np.linspace(0, 30, 10007)
+        exact = Structure.VerticalMassFraction(r)
+        np.testing.assert_allclose(Structure.TabulatedVerticalMassFraction(r), exact, rtol=1e-10)
+        self.assertLess(Structure.tableError, 1e-10)
 
-
-
+        self.inp.distanceBetweenVerticalCables = 10
+        structure = Structure(self.inp, rotationalRadius=10)
+        radii = structure.coRotationalRadius * np.array([0, 0.1, 1, 5, 40])
+        exact = structure.ComputeVerticalStructuralFraction(radii)
+        self.inp.isStructureTabulated = True
+        np.testing.assert_allclose(structure.ComputeVerticalStructuralFraction(radii), exact, rtol=1e-10)